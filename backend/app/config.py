@@ -44,6 +44,7 @@ class Settings(BaseSettings):
         token_file_path: Path to token storage file
         log_level: Logging level
         track_cache_ttl_days: Days to keep track metadata in cache (default: 30)
+        track_cache_max_entries: Cap on cached tracks; oldest-accessed are evicted past it (default: 100000)
     """
     
     # Spotify API Configuration (supports Docker secrets via /run/secrets)
@@ -80,6 +81,7 @@ class Settings(BaseSettings):
     
     # Track Cache Configuration
     track_cache_ttl_days: int = 30
+    track_cache_max_entries: int = 100000
     
     # Pagination Configuration
     playlist_page_size: int = 100
@@ -4,6 +4,7 @@ Database management for sort jobs using SQLite.
 
 import os
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional
 import logging
@@ -14,6 +15,15 @@ logger = logging.getLogger(__name__)
 # Database file location (env override for tests)
 DB_PATH = Path(os.getenv("PLAYLISTPOLISHER_DB_PATH", "/data/playlist_polisher.db"))
 
+# Connection pool: SQLite allows one writer at a time anyway, so the process
+# keeps a single long-lived write connection handed out under a lock, plus
+# one read-only connection per thread. Reusing them skips the per-call
+# connect + PRAGMA replay that dominated hot paths like job polling.
+_write_lock = threading.RLock()
+_write_conn: Optional[sqlite3.Connection] = None
+_write_depth = threading.local()
+_read_local = threading.local()
+
 
 def init_db():
     """Initialize the database with required tables."""
@@ -21,7 +31,11 @@ def init_db():
     
     conn = sqlite3.connect(str(DB_PATH))
     cursor = conn.cursor()
-    
+
+    # WAL lets readers proceed while sort/cleanup writes commit; it is a
+    # persistent database property, so set it once here.
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     # Create sort_jobs table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS sort_jobs (
@@ -44,9 +58,22 @@ def init_db():
         )
     """)
     
-    # Create index for faster lookups
+    # Migration: composite indexes matched to the hot SortJobService
+    # queries (active-job lookup, per-user counts/history, cleanup scan).
+    # The old single-column indexes are prefixes of these and go away.
+    cursor.execute("DROP INDEX IF EXISTS idx_playlist_id")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sort_jobs_playlist_status_started
+        ON sort_jobs(playlist_id, status, started_at DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sort_jobs_user_status ON sort_jobs(user_id, status)
+    """)
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_playlist_id ON sort_jobs(playlist_id)
+        CREATE INDEX IF NOT EXISTS idx_sort_jobs_user_started ON sort_jobs(user_id, started_at DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sort_jobs_status_completed ON sort_jobs(status, completed_at)
     """)
     
     # Create oauth_states table for temporary state storage
@@ -107,13 +134,10 @@ def init_db():
         )
     """)
     
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_user_id ON sort_jobs(user_id)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_status ON sort_jobs(status)
-    """)
+    # (A previous CREATE INDEX idx_user_id ON sort_jobs(user_id) here was a
+    # no-op: the name was already taken by the user_sessions index above.
+    # The composite sort_jobs indexes earlier in this function cover it.)
+    cursor.execute("DROP INDEX IF EXISTS idx_status")
 
     # History of bulk playlist operations (undo support)
     cursor.execute("""
@@ -189,8 +213,12 @@ def init_db():
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_ignored_pairs_session ON ignored_pairs(session_id)
     """)
+    # Migration: the lookup index now includes playlist_id so the
+    # duplicate-analysis query is an index-only scan
+    cursor.execute("DROP INDEX IF EXISTS idx_ignored_pairs_lookup")
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_ignored_pairs_lookup ON ignored_pairs(session_id, track_id_1, track_id_2)
+        CREATE INDEX IF NOT EXISTS idx_ignored_pairs_canonical
+        ON ignored_pairs(session_id, playlist_id, track_id_1, track_id_2)
     """)
     
     # Track cache (global, shared across users)
@@ -234,11 +262,14 @@ def init_db():
             FOREIGN KEY (session_id) REFERENCES user_sessions(session_id) ON DELETE CASCADE
         )
     """)
+    # Migration: the PK already covers (track_id, session_id) probes; the
+    # session-side index now includes track_id so session-scoped joins and
+    # DISTINCT track_id counts are index-only. The plain track_id index was
+    # redundant with the PK prefix.
+    cursor.execute("DROP INDEX IF EXISTS idx_track_usage_session")
+    cursor.execute("DROP INDEX IF EXISTS idx_track_usage_track")
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_track_usage_session ON track_usage(session_id)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_track_usage_track ON track_usage(track_id)
+        CREATE INDEX IF NOT EXISTS idx_usage_session_track ON track_usage(session_id, track_id)
     """)
 
     # Cached playlist items (local playlist snapshot with added_at timestamps)
@@ -277,6 +308,16 @@ def init_db():
         CREATE INDEX IF NOT EXISTS idx_playlist_cache_facts_last_track ON playlist_cache_facts(last_track_added_at_utc DESC)
     """)
 
+    # Last-known playlist names (rendered in cross-playlist history without
+    # a Spotify round trip)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS playlist_names (
+            playlist_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            updated_at_utc TEXT NOT NULL
+        )
+    """)
+
     # Daily reconciliation run tracking
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS cache_facts_runs (
@@ -291,15 +332,63 @@ def init_db():
     logger.info(f"Database initialized at {DB_PATH}")
 
 
+def _tune_connection(conn: sqlite3.Connection) -> None:
+    # Per-connection tuning: NORMAL sync is safe under WAL and halves fsyncs;
+    # temp tables and a larger page cache stay in memory. The busy timeout
+    # makes cache-warm worker writes wait out a concurrent writer instead of
+    # surfacing SQLITE_BUSY. Applied once per pooled connection.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA busy_timeout=5000")
+
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    """Context manager yielding the process-wide write connection.
+
+    The connection is created once and handed out under a re-entrant lock,
+    so callers keep the existing one-writer-at-a-time semantics without
+    re-paying connection setup. Any transaction a caller leaves open (e.g.
+    on an exception before commit) is rolled back when the outermost holder
+    releases the lock, so the next caller starts clean.
+    """
+    global _write_conn
+    _write_lock.acquire()
+    depth = getattr(_write_depth, "value", 0)
+    _write_depth.value = depth + 1
     try:
-        yield conn
+        if _write_conn is None:
+            conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            _tune_connection(conn)
+            _write_conn = conn
+        yield _write_conn
     finally:
-        conn.close()
+        _write_depth.value = depth
+        if depth == 0 and _write_conn is not None and _write_conn.in_transaction:
+            _write_conn.rollback()
+        _write_lock.release()
+
+
+@contextmanager
+def get_read_connection():
+    """Context manager yielding this thread's read-only connection.
+
+    Opened with mode=ro so it can never take the write lock; under WAL
+    these run concurrently with each other and with the single writer,
+    keeping stats/status queries responsive during cache-warm bursts. One
+    connection is kept per thread and reused across calls.
+    """
+    conn = getattr(_read_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        _read_local.conn = conn
+    yield conn
 
 
 # Initialize database on module import
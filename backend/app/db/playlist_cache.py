@@ -81,6 +81,79 @@ def upsert_cache_facts(
         conn.commit()
 
 
+def refresh_many(batch: List[Dict]) -> List[str]:
+    """Refresh several cached playlists under a single transaction.
+
+    Each batch entry carries ``playlist_id``, ``items``, and ``snapshot_id``.
+    One BEGIN IMMEDIATE/COMMIT covers the whole batch so cache-warm workers
+    pay one journal write per batch instead of several per playlist. A bad
+    entry is rolled back to its savepoint and reported in the returned list
+    without discarding the rest of the batch.
+    """
+    if not batch:
+        return []
+    now = _now_iso()
+    failed: List[str] = []
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        for entry in batch:
+            playlist_id = entry["playlist_id"]
+            items = entry.get("items") or []
+            snapshot_id = entry.get("snapshot_id")
+            try:
+                cur.execute("SAVEPOINT refresh_one")
+                cur.execute("DELETE FROM playlist_cache_items WHERE playlist_id = ?", (playlist_id,))
+                if items:
+                    cur.executemany(
+                        """
+                        INSERT INTO playlist_cache_items
+                        (playlist_id, position, track_id, added_at, cached_at, snapshot_id)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                playlist_id,
+                                item["position"],
+                                item["track_id"],
+                                item.get("added_at"),
+                                now,
+                                snapshot_id,
+                            )
+                            for item in items
+                        ],
+                    )
+                # Facts derived from the rows just written - no re-select.
+                last_added = max(
+                    (item.get("added_at") for item in items if item.get("added_at")),
+                    default=None,
+                )
+                cur.execute(
+                    """
+                    INSERT INTO playlist_cache_facts
+                    (playlist_id, last_track_added_at_utc, track_count_cached, last_cached_at_utc,
+                     is_dirty, updated_at_utc, last_snapshot_id, facts_version)
+                    VALUES (?, ?, ?, ?, 0, ?, ?, 1)
+                    ON CONFLICT(playlist_id) DO UPDATE SET
+                      last_track_added_at_utc = excluded.last_track_added_at_utc,
+                      track_count_cached = excluded.track_count_cached,
+                      last_cached_at_utc = excluded.last_cached_at_utc,
+                      is_dirty = excluded.is_dirty,
+                      updated_at_utc = excluded.updated_at_utc,
+                      last_snapshot_id = excluded.last_snapshot_id,
+                      facts_version = excluded.facts_version
+                    """,
+                    (playlist_id, last_added, len(items), now, now, snapshot_id),
+                )
+                cur.execute("RELEASE refresh_one")
+            except Exception:
+                cur.execute("ROLLBACK TO refresh_one")
+                cur.execute("RELEASE refresh_one")
+                failed.append(playlist_id)
+        conn.commit()
+    return failed
+
+
 def refresh_cached_playlist(
     *,
     playlist_id: str,
@@ -266,6 +339,77 @@ def get_cached_playlist_tracks(playlist_id: str, cutoff_iso: Optional[str] = Non
         return [dict(row) for row in cur.fetchall()]
 
 
+def upsert_names(names: Dict[str, str]) -> None:
+    """Record last-known playlist names (used for history rendering)."""
+    rows = [(pid, name) for pid, name in names.items() if pid and name]
+    if not rows:
+        return
+    now = _now_iso()
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.executemany(
+            """
+            INSERT INTO playlist_names (playlist_id, name, updated_at_utc)
+            VALUES (?, ?, ?)
+            ON CONFLICT(playlist_id) DO UPDATE SET
+              name = excluded.name,
+              updated_at_utc = excluded.updated_at_utc
+            """,
+            [(pid, name, now) for pid, name in rows],
+        )
+        conn.commit()
+
+
+def get_names(playlist_ids: Iterable[str]) -> Dict[str, str]:
+    """Bulk lookup of last-known playlist names."""
+    ids = [pid for pid in playlist_ids if pid]
+    if not ids:
+        return {}
+    placeholders = ",".join(["?"] * len(ids))
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            f"SELECT playlist_id, name FROM playlist_names WHERE playlist_id IN ({placeholders})",
+            tuple(ids),
+        )
+        return {row["playlist_id"]: row["name"] for row in cur.fetchall()}
+
+
+def count_fresh_page_items(playlist_id: str, offset: int, limit: int, cutoff_iso: str) -> int:
+    """
+    Count positions in [offset, offset+limit) backed by fresh track_cache rows.
+
+    Returns 0 when the playlist has no cache facts or is marked dirty, so a
+    full-page count means the page is completely cache-warm and callers can
+    skip re-warming it.
+    """
+    if not playlist_id:
+        return 0
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT is_dirty FROM playlist_cache_facts WHERE playlist_id = ?",
+            (playlist_id,),
+        )
+        row = cur.fetchone()
+        if not row or row["is_dirty"]:
+            return 0
+        cur.execute(
+            """
+            SELECT COUNT(*) AS fresh
+            FROM playlist_cache_items pci
+            JOIN track_cache tc ON tc.track_id = pci.track_id
+            WHERE pci.playlist_id = ?
+              AND pci.position >= ?
+              AND pci.position < ?
+              AND tc.cached_at > ?
+            """,
+            (playlist_id, offset, offset + limit, cutoff_iso),
+        )
+        result = cur.fetchone()
+    return result["fresh"] if result else 0
+
+
 def _get_last_reconcile_run() -> Optional[str]:
     with get_db_connection() as conn:
         cur = conn.cursor()
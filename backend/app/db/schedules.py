@@ -133,11 +133,16 @@ def get_schedule(schedule_id: int, user_id: str) -> Optional[Dict[str, Any]]:
     return _row_to_dict(row) if row else None
 
 
-def update_schedule(schedule_id: int, user_id: str, **fields) -> bool:
+def update_schedule(schedule_id: int, user_id: str, **fields) -> Optional[Dict[str, Any]]:
+    """Apply updates and return the updated row, or None if it doesn't exist.
+
+    Passing ``next_run_at=None`` clears the stored value and recomputes it
+    from the updated params in the same transaction, so callers don't need a
+    follow-up select + update pair.
+    """
     allowed = {"frequency_minutes", "next_run_at", "enabled", "status", "last_error", "params"}
     updates = []
     params = []
-    manual_next_run = fields.get("next_run_at") is not None
     for key, val in fields.items():
         if key not in allowed:
             continue
@@ -146,7 +151,7 @@ def update_schedule(schedule_id: int, user_id: str, **fields) -> bool:
         updates.append(f"{key} = ?")
         params.append(val)
     if not updates:
-        return False
+        return get_schedule(schedule_id, user_id)
     updates.append("updated_at = ?")
     params.append(_now_iso())
     params.extend([schedule_id, user_id])
@@ -156,8 +161,20 @@ def update_schedule(schedule_id: int, user_id: str, **fields) -> bool:
             f"UPDATE playlist_schedules SET {', '.join(updates)} WHERE id = ? AND user_id = ?",
             params,
         )
+        if cur.rowcount == 0:
+            conn.commit()
+            return None
+        cur.execute("SELECT * FROM playlist_schedules WHERE id = ? AND user_id = ?", (schedule_id, user_id))
+        updated = _row_to_dict(cur.fetchone())
+        if updated.get("next_run_at") is None:
+            next_run = _compute_next_run(updated)
+            cur.execute(
+                "UPDATE playlist_schedules SET next_run_at = ? WHERE id = ? AND user_id = ?",
+                (next_run, schedule_id, user_id),
+            )
+            updated["next_run_at"] = next_run
         conn.commit()
-        return cur.rowcount > 0
+        return updated
 
 
 def delete_schedule(schedule_id: int, user_id: str) -> bool:
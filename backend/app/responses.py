@@ -0,0 +1,31 @@
+"""
+Custom response classes for hot endpoints.
+
+FastAPI's default flow runs every handler return value through
+`jsonable_encoder` plus a response-model validation pass before the JSON
+encoder sees it. For list-heavy endpoints (playlists, paginated tracks) that
+double traversal dominates serialization cost, so the hot routes build an
+`ORJSONResponse` from pre-dumped content instead and skip the encoder
+entirely.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson (handles datetime/UUID natively)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
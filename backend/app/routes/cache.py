@@ -6,7 +6,7 @@ Provides endpoints for viewing cache statistics and managing cached track data.
 
 import logging
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 from typing import Optional, List
 
@@ -275,6 +275,7 @@ async def warm_playlist_cache(
 
 @router.get("/warm/status", response_model=CacheWarmStatusResponse)
 async def get_cache_warm_status_route(
+    response: Response,
     session_mgr: SessionManager = Depends(require_auth),
 ):
     """Return current cache warm status for the user."""
@@ -284,18 +285,25 @@ async def get_cache_warm_status_route(
             raise HTTPException(status_code=401, detail="Authentication required. Please login with Spotify.")
         status = get_cache_warm_status(user_id)
         if not status:
-            return {
+            result = {
                 "status": "idle",
                 "total": 0,
                 "completed": 0,
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }
-        return {
-            "status": status.get("status", "idle"),
-            "total": status.get("total", 0),
-            "completed": status.get("completed", 0),
-            "updated_at": status.get("updated_at") or datetime.now(timezone.utc).isoformat(),
-        }
+        else:
+            result = {
+                "status": status.get("status", "idle"),
+                "total": status.get("total", 0),
+                "completed": status.get("completed", 0),
+                "updated_at": status.get("updated_at") or datetime.now(timezone.utc).isoformat(),
+            }
+        # Let idle clients back off: the status only changes while a warm job
+        # is running, so blind polling can be absorbed by the browser cache.
+        max_age = 30 if result["status"] == "idle" else 1
+        response.headers["Cache-Control"] = f"private, max-age={max_age}"
+        response.headers["ETag"] = f'"{hash((result["total"], result["completed"], result["status"]))}"'
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -5,10 +5,12 @@ Logs playback-related events from the frontend for audit/debugging.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 import logging
 
+import msgspec
+
 from app.utils.session_manager import SessionManager, SESSION_COOKIE_NAME
 
 logger = logging.getLogger(__name__)
@@ -32,41 +34,66 @@ def require_auth(session_mgr: SessionManager = Depends(get_session_manager)) ->
     return session_mgr
 
 
-class PlayerEvent(BaseModel):
-    event: str = Field(..., description="Playback event name")
-    track_id: Optional[str] = Field(None, description="Spotify track id")
-    track_uri: Optional[str] = Field(None, description="Spotify track uri")
-    track_name: Optional[str] = Field(None, description="Track name")
-    artists: Optional[List[str]] = Field(default_factory=list, description="Artist names")
-    context_uri: Optional[str] = Field(None, description="Playback context uri")
-    device_name: Optional[str] = Field(None, description="Playback device name")
-    remote: Optional[bool] = Field(None, description="Playback is running on a remote device")
+class PlayerEvent(msgspec.Struct, omit_defaults=True):
+    """Playback event reported by the frontend player."""
+    event: str
+    track_id: Optional[str] = None
+    track_uri: Optional[str] = None
+    track_name: Optional[str] = None
+    artists: Optional[List[str]] = None
+    context_uri: Optional[str] = None
+    device_name: Optional[str] = None
+    remote: Optional[bool] = None
+
+
+class FrontendLog(msgspec.Struct, omit_defaults=True):
+    """Log line forwarded from the frontend console."""
+    level: str
+    message: str
+    data: Optional[dict] = None
 
 
-class FrontendLog(BaseModel):
-    level: str = Field(..., description="Log level: debug, info, warn, error")
-    message: str = Field(..., description="Log message")
-    data: Optional[dict] = Field(None, description="Additional data to log")
+# These endpoints only format log strings from their payloads, so they skip
+# Pydantic validation in favour of msgspec's C decoder.
+_PLAYER_EVENT_DECODER = msgspec.json.Decoder(PlayerEvent)
+_FRONTEND_LOG_DECODER = msgspec.json.Decoder(FrontendLog)
+
+_OK_RESPONSE = {"status": "ok"}
 
 
 @router.post("/log")
 async def log_frontend_message(
-    payload: FrontendLog,
-    session_mgr: SessionManager = Depends(require_auth)
+    request: Request,
+    session_mgr: SessionManager = Depends(get_session_manager)
 ):
     """Log frontend messages to backend log file."""
-    user_id = session_mgr.get_user_id() or "unknown"
+    try:
+        payload = _FRONTEND_LOG_DECODER.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     level = payload.level.lower()
+
+    # Debug is the noisiest level and is dropped anyway - bail out before
+    # paying for the session lookup that authentication requires.
+    if level == "debug":
+        return ORJSONResponse(_OK_RESPONSE)
+
+    if not session_mgr.is_authenticated():
+        raise HTTPException(
+            status_code=401,
+            detail="Authentication required. Please login with Spotify."
+        )
+
+    user_id = session_mgr.get_user_id() or "unknown"
     message = f"[Frontend] {payload.message}"
-    
+
     if payload.data:
         message += f" | data={payload.data}"
-    
+
     message += f" [user={user_id}]"
-    
-    if level == "debug":
-        return {"status": "ok"}
-    elif level == "info":
+
+    if level == "info":
         logger.info(message)
     elif level == "warn":
         logger.warning(message)
@@ -74,26 +101,37 @@ async def log_frontend_message(
         logger.error(message)
     else:
         logger.info(message)
-    
-    return {"status": "ok"}
+
+    return ORJSONResponse(_OK_RESPONSE)
 
 
 @router.post("/events")
 async def log_player_event(
-    payload: PlayerEvent,
+    request: Request,
     session_mgr: SessionManager = Depends(require_auth)
 ):
     """Log playback events for operational visibility."""
+    try:
+        payload = _PLAYER_EVENT_DECODER.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     user_id = session_mgr.get_user_id() or "unknown"
     track_label = payload.track_name or payload.track_id or payload.track_uri or "Unknown track"
-    artists_label = ", ".join(payload.artists or []) if payload.artists else "Unknown artist"
-    extras = []
-    if payload.context_uri:
-        extras.append(f"context={payload.context_uri}")
-    if payload.device_name:
-        extras.append(f"device={payload.device_name}")
-    if payload.remote is not None:
-        extras.append(f"remote={payload.remote}")
+    artists_label = ", ".join(payload.artists) if payload.artists else "Unknown artist"
+    extras = [
+        f"{key}={value}"
+        for key, value in (
+            ("context", payload.context_uri),
+            ("device", payload.device_name),
+            ("remote", payload.remote),
+        )
+        if value is not None
+    ]
     suffix = f" ({', '.join(extras)})" if extras else ""
-    logger.info(f"Playback event: {payload.event} - {track_label} — {artists_label}{suffix} [user={user_id}]")
-    return {"status": "ok"}
+    # %-style args keep formatting lazy if the info level is ever disabled.
+    logger.info(
+        "Playback event: %s - %s — %s%s [user=%s]",
+        payload.event, track_label, artists_label, suffix, user_id,
+    )
+    return ORJSONResponse(_OK_RESPONSE)
@@ -8,21 +8,33 @@ This module defines all playlist-related API endpoints including:
 All routes are prefixed with /playlists and require authentication.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Path, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Path, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
+import re
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from time import monotonic
 from spotipy.exceptions import SpotifyException
-import time
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 import json
 
+import msgspec
+import orjson
+
+from app.responses import ORJSONResponse
+from app.services.cache_service import CacheService
 from app.services.spotify_service import SpotifyService, get_spotify_service
 from app.config import settings
 from app.models.schemas import PlaylistSimple, PlaylistContextMeta, PlaylistDetail, ErrorResponse, PaginatedTracks
 from app.utils.session_manager import SessionManager, SESSION_COOKIE_NAME
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from app.db import operations as op_store
 from app.db import preferences as preference_store
 from app.db import playlist_cache as playlist_cache_store
@@ -32,6 +44,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/playlists", tags=["playlists"])
 
+# Rust-backed serializer for the pagination hot path; built once at import
+# time so each request only pays for dump_json itself.
+_PAGINATED_TRACKS_ADAPTER = TypeAdapter(PaginatedTracks)
+
 
 def get_session_manager(request: Request) -> SessionManager:
     """Extract session manager from the incoming request cookie."""
@@ -39,6 +55,18 @@ def get_session_manager(request: Request) -> SessionManager:
     return SessionManager(session_id=session_id)
 
 
+def _raise_spotify_http_error(e: SpotifyException, playlist_id: str) -> None:
+    """Map a SpotifyException onto the matching HTTPException via http_status."""
+    if e.http_status == 404:
+        logger.warning(f"Playlist not found: {playlist_id}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"Playlist not found: {playlist_id}"
+        )
+    logger.error(f"Spotify error for playlist {playlist_id}: {e}")
+    raise HTTPException(status_code=e.http_status or 500, detail=e.msg or str(e))
+
+
 def require_auth(session_mgr: SessionManager = Depends(get_session_manager)) -> SessionManager:
     """
     Authentication Dependency
@@ -59,8 +87,9 @@ def require_auth(session_mgr: SessionManager = Depends(get_session_manager)) ->
     return session_mgr
 
 
-@router.get("/", response_model=List[PlaylistSimple])
+@router.get("/", response_class=ORJSONResponse, responses={200: {"model": List[PlaylistSimple]}})
 async def get_playlists(
+    background: BackgroundTasks,
     session_mgr: SessionManager = Depends(require_auth),
     spotify: SpotifyService = Depends(get_spotify_service)
 ):
@@ -96,9 +125,17 @@ async def get_playlists(
         playlists regardless of total count.
     """
     try:
-        playlists = spotify.get_user_playlists()
+        # spotipy is blocking; run it off the event loop so concurrent
+        # requests aren't serialized behind this HTTP call.
+        playlists = await run_in_threadpool(spotify.get_user_playlists)
         logger.info(f"Fetched {len(playlists)} playlists for user")
-        return playlists
+        # Keep the name cache warm so history rendering stays network-free
+        background.add_task(
+            playlist_cache_store.upsert_names, {p.id: p.name for p in playlists}
+        )
+        # Dump the models ourselves so FastAPI skips jsonable_encoder and the
+        # response-model revalidation pass on this list-heavy endpoint.
+        return ORJSONResponse([p.model_dump() for p in playlists])
     except ValueError as e:
         logger.error(f"Authentication error: {e}")
         raise HTTPException(status_code=401, detail=str(e))
@@ -110,7 +147,7 @@ async def get_playlists(
         )
 
 
-@router.get("/{playlist_id}", response_model=PlaylistDetail)
+@router.get("/{playlist_id}", response_class=ORJSONResponse, responses={200: {"model": PlaylistDetail}})
 async def get_playlist(
     playlist_id: str = Path(..., description="Spotify playlist ID"),
     session_mgr: SessionManager = Depends(require_auth),
@@ -165,24 +202,22 @@ async def get_playlist(
         user_id = session_mgr.get_user_id()
         should_warm_cache = True
         if user_id:
-            should_warm_cache = preference_store.should_warm_playlist_cache(user_id, playlist_id)
-        playlist = spotify.get_playlist_details(playlist_id, should_warm_cache=should_warm_cache)
-        logger.info(f"Fetched playlist '{playlist.name}' with {playlist.total_tracks} tracks")
-        return playlist
+            should_warm_cache = await run_in_threadpool(
+                preference_store.should_warm_playlist_cache, user_id, playlist_id
+            )
+        # Stream tracks page by page so TTFB and peak memory stay flat for
+        # large playlists. The metadata fetch (and its 404) happens before
+        # the response starts.
+        playlist_stream = await run_in_threadpool(
+            spotify.open_playlist_detail_stream, playlist_id, should_warm_cache=should_warm_cache
+        )
+        return StreamingResponse(playlist_stream, media_type="application/json")
     except ValueError as e:
         logger.error(f"Authentication error: {e}")
         raise HTTPException(status_code=401, detail=str(e))
+    except SpotifyException as e:
+        _raise_spotify_http_error(e, playlist_id)
     except Exception as e:
-        error_msg = str(e)
-        
-        # Check if it's a "not found" error
-        if "404" in error_msg or "not found" in error_msg.lower():
-            logger.warning(f"Playlist not found: {playlist_id}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Playlist not found: {playlist_id}"
-            )
-        
         logger.error(f"Failed to fetch playlist {playlist_id}: {e}")
         raise HTTPException(
             status_code=500,
@@ -190,7 +225,7 @@ async def get_playlist(
         )
 
 
-@router.get("/{playlist_id}/summary", response_model=PlaylistContextMeta)
+@router.get("/{playlist_id}/summary", response_class=ORJSONResponse, responses={200: {"model": PlaylistContextMeta}})
 async def get_playlist_summary(
     playlist_id: str = Path(..., description="Spotify playlist ID"),
     session_mgr: SessionManager = Depends(require_auth),
@@ -198,19 +233,14 @@ async def get_playlist_summary(
 ):
     """Get lightweight playlist metadata without loading tracks."""
     try:
-        meta = spotify.get_playlist_context_meta(playlist_id)
-        return meta
+        meta = await run_in_threadpool(spotify.get_playlist_context_meta, playlist_id)
+        return ORJSONResponse(meta.model_dump())
     except ValueError as e:
         logger.error(f"Authentication error: {e}")
         raise HTTPException(status_code=401, detail=str(e))
+    except SpotifyException as e:
+        _raise_spotify_http_error(e, playlist_id)
     except Exception as e:
-        error_msg = str(e)
-        if "404" in error_msg or "not found" in error_msg.lower():
-            logger.warning(f"Playlist not found: {playlist_id}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Playlist not found: {playlist_id}"
-            )
         logger.error(f"Failed to fetch playlist summary {playlist_id}: {e}")
         raise HTTPException(
             status_code=500,
@@ -218,7 +248,7 @@ async def get_playlist_summary(
         )
 
 
-@router.get("/{playlist_id}/tracks", response_model=PaginatedTracks)
+@router.get("/{playlist_id}/tracks", response_class=ORJSONResponse, responses={200: {"model": PaginatedTracks}})
 async def get_playlist_tracks_paginated(
     playlist_id: str = Path(..., description="Spotify playlist ID"),
     offset: int = 0,
@@ -253,18 +283,33 @@ async def get_playlist_tracks_paginated(
         # Enforce max limit of 100 (Spotify API constraint)
         limit = min(limit, 100)
         
-        user_id = session_mgr.get_user_id()
-        should_warm_cache = True
-        if user_id:
-            should_warm_cache = preference_store.should_warm_playlist_cache(user_id, playlist_id)
-        
-        tracks, total, cache_hits, cache_misses, cache_warmed = spotify.get_playlist_tracks_paginated(
+        # When every position on this page is already backed by fresh cache
+        # rows, skip the preference lookup and all cache bookkeeping writes.
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=settings.track_cache_ttl_days)).isoformat()
+        page_is_warm = await run_in_threadpool(
+            playlist_cache_store.count_fresh_page_items, playlist_id, offset, limit, cutoff
+        ) >= limit
+
+        should_warm_cache = not page_is_warm
+        if should_warm_cache:
+            user_id = session_mgr.get_user_id()
+            if user_id:
+                should_warm_cache = await run_in_threadpool(
+                    preference_store.should_warm_playlist_cache, user_id, playlist_id
+                )
+
+        tracks, total, cache_hits, cache_misses, cache_warmed = await run_in_threadpool(
+            spotify.get_playlist_tracks_paginated,
             playlist_id,
             offset=offset,
             limit=limit,
             should_warm_cache=should_warm_cache
         )
         
+        if page_is_warm:
+            cache_hits = len(tracks)
+            cache_misses = 0
+
         has_more = (offset + len(tracks)) < total
         
         logger.info(
@@ -273,8 +318,8 @@ async def get_playlist_tracks_paginated(
         )
         
         from app.models.schemas import CacheInfo
-        
-        return PaginatedTracks(
+
+        page = PaginatedTracks(
             tracks=tracks,
             offset=offset,
             limit=limit,
@@ -287,17 +332,16 @@ async def get_playlist_tracks_paginated(
                 details={"track_count": len(tracks)}
             )
         )
+        return Response(
+            content=_PAGINATED_TRACKS_ADAPTER.dump_json(page),
+            media_type="application/json"
+        )
     except ValueError as e:
         logger.error(f"Authentication error: {e}")
         raise HTTPException(status_code=401, detail=str(e))
+    except SpotifyException as e:
+        _raise_spotify_http_error(e, playlist_id)
     except Exception as e:
-        error_msg = str(e)
-        if "404" in error_msg or "not found" in error_msg.lower():
-            logger.warning(f"Playlist not found: {playlist_id}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Playlist not found: {playlist_id}"
-            )
         logger.error(f"Failed to fetch playlist tracks {playlist_id}: {e}")
         raise HTTPException(
             status_code=500,
@@ -345,8 +389,17 @@ async def update_playlist(
             body.collaborative,
             bool(body.description),
         )
-        sp.playlist_change_details(playlist_id, **change_kwargs)
-        updated = sp.playlist(playlist_id, fields="id,name,public,collaborative,description,owner(id)")
+        await run_in_threadpool(sp.playlist_change_details, playlist_id, **change_kwargs)
+
+        # Visibility flags are the only fields Spotify is known to silently
+        # ignore; name/description-only updates don't need the verify fetch.
+        if body.public is None and body.collaborative is None:
+            logger.info("Updated playlist %s (metadata only, no verification fetch)", playlist_id)
+            return {"message": "Playlist updated", "public": None, "collaborative": None}
+
+        updated = await run_in_threadpool(
+            sp.playlist, playlist_id, fields="id,name,public,collaborative,description,owner(id)"
+        )
 
         applied_public = updated.get("public")
         applied_collab = updated.get("collaborative")
@@ -356,11 +409,13 @@ async def update_playlist(
             logger.warning("Initial update mismatch public=%s -> %s for playlist %s (user=%s owner=%s), retrying with collaborative=False then public=%s", body.public, applied_public, playlist_id, session_mgr.get_user_id(), owner_id, body.public)
             try:
                 # Retry with collaborative forced false, then public flag in a second step to mirror desktop behavior
-                sp.playlist_change_details(playlist_id, collaborative=False)
-                time.sleep(0.3)
-                sp.playlist_change_details(playlist_id, public=body.public)
-                time.sleep(0.3)
-                updated = sp.playlist(playlist_id, fields="id,name,public,collaborative,description,owner(id)")
+                await run_in_threadpool(sp.playlist_change_details, playlist_id, collaborative=False)
+                await asyncio.sleep(0.3)
+                await run_in_threadpool(sp.playlist_change_details, playlist_id, public=body.public)
+                await asyncio.sleep(0.3)
+                updated = await run_in_threadpool(
+                    sp.playlist, playlist_id, fields="id,name,public,collaborative,description,owner(id)"
+                )
                 applied_public = updated.get("public")
                 applied_collab = updated.get("collaborative")
                 owner_id = updated.get("owner", {}).get("id")
@@ -416,6 +471,7 @@ class PlaylistCloneRequest(BaseModel):
     public: Optional[bool] = None
     collaborative: Optional[bool] = None
     description: Optional[str] = None
+    dedupe: bool = Field(False, description="Drop duplicate track URIs when cloning")
 
 
 class PlaylistTrackAddRequest(BaseModel):
@@ -495,26 +551,195 @@ class DuplicateRemovalRequest(BaseModel):
     snapshot_id: Optional[str] = None
 
 
-def _fetch_playlist_items(sp: Any, playlist_id: str) -> List[Dict[str, Any]]:
-    """Fetch all playlist items with pagination."""
-    items: List[Dict[str, Any]] = []
-    limit = 100
-    offset = 0
-    while True:
-        res = sp.playlist_items(
-            playlist_id,
-            limit=limit,
-            offset=offset,
-            fields="items(track(id,name,uri,duration_ms,artists(name),album(name,images,album_type,total_tracks,release_date,release_date_precision)),added_at,added_by.id),next"
-        )
-        page_items = res.get("items", []) or []
-        items.extend(page_items)
-        if not res.get("next"):
-            break
-        offset += limit
+_PAGE_LIMIT = 100
+# Bounded fan-out keeps us friendly to Spotify's rate limits.
+_PAGE_CONCURRENCY = 8
+
+# Prebuilt fields strings shared by every page request in this module.
+_PLAYLIST_ITEMS_FULL_FIELDS = (
+    "items(track(id,name,uri,duration_ms,artists(name),"
+    "album(name,images,album_type,total_tracks,release_date,release_date_precision)),"
+    "added_at,added_by.id),total"
+)
+_PLAYLIST_ITEMS_URI_FIELDS = "items(track(uri)),total"
+_SNAPSHOT_FIELDS = "snapshot_id"
+_SNAPSHOT_TOTAL_FIELDS = "snapshot_id,tracks.total"
+
+# Snapshot probes repeat within a request burst (remove -> verify -> history
+# refresh); a sub-second memo collapses the duplicates without risking
+# staleness. Mutating paths invalidate their entry before re-probing.
+_SNAPSHOT_PROBE_TTL = 0.5
+_snapshot_probe_cache: Dict[str, Any] = {}
+
+
+def _probe_snapshot(sp: Any, playlist_id: str) -> Optional[str]:
+    cached = _snapshot_probe_cache.get(playlist_id)
+    if cached and monotonic() - cached[0] < _SNAPSHOT_PROBE_TTL:
+        return cached[1]
+    snapshot = sp.playlist(playlist_id, fields=_SNAPSHOT_FIELDS).get("snapshot_id")
+    if len(_snapshot_probe_cache) >= 1024:
+        _snapshot_probe_cache.clear()
+    _snapshot_probe_cache[playlist_id] = (monotonic(), snapshot)
+    return snapshot
+
+
+def _invalidate_snapshot_probe(playlist_id: str) -> None:
+    _snapshot_probe_cache.pop(playlist_id, None)
+
+
+# Canonical (low, high) ordering is pushed into the indexed scan so the
+# duplicate-analysis filter loop never has to sort pair tuples. Kept as a
+# constant so every execution presents sqlite3's statement cache the same
+# string.
+_IGNORED_PAIRS_SQL = """
+    SELECT DISTINCT
+        CASE WHEN track_id_1 < track_id_2 THEN track_id_1 ELSE track_id_2 END AS a,
+        CASE WHEN track_id_1 < track_id_2 THEN track_id_2 ELSE track_id_1 END AS b
+    FROM ignored_pairs
+    WHERE session_id = ? AND (playlist_id = ? OR playlist_id IS NULL)
+"""
+
+class DuplicateOccurrence(msgspec.Struct):
+    """One playlist slot inside a duplicate group (slotted, not a dict)."""
+
+    uri: Optional[str]
+    position: int
+    added_at: Optional[str]
+    added_by: Optional[str]
+    name: Optional[str]
+    artists: List[Optional[str]]
+    artist_ids: List[Optional[str]]
+    artist_uris: List[Optional[str]]
+    artist_external_urls: List[Optional[str]]
+    album: Optional[str]
+    album_id: Optional[str]
+    album_uri: Optional[str]
+    album_external_url: Optional[str]
+    album_images: List[Any]
+    duration_ms: Optional[int]
+    reason: str
+    track_id: Optional[str]
+    album_type: Optional[str]
+    album_total_tracks: Optional[int]
+    album_release_date: Optional[str]
+    album_release_date_precision: Optional[str]
+    album_preference_score: int
+
+
+class DuplicateGroup(msgspec.Struct):
+    """A set of occurrences sharing a match key."""
+
+    track_id: str
+    track_uri: Optional[str]
+    name: Optional[str]
+    artists: List[Optional[str]]
+    artist_ids: List[Optional[str]]
+    artist_uris: List[Optional[str]]
+    artist_external_urls: List[Optional[str]]
+    album: Optional[str]
+    album_id: Optional[str]
+    album_uri: Optional[str]
+    album_external_url: Optional[str]
+    album_images: List[Any]
+    occurrences: List[DuplicateOccurrence]
+    match_key: str
+    track_ids: List[str]
+
+
+# Album-release preference ranking for duplicate resolution.
+_ALBUM_PREF_SCORES = {"album": 3, "single": 2, "compilation": 1}
+
+
+def _album_pref_score(album: Dict[str, Any]) -> int:
+    return _ALBUM_PREF_SCORES.get((album or {}).get("album_type") or "", 0)
+
+
+async def _gather_playlist_pages(
+    sp: Any, playlist_id: str, fields: str, known_total: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all playlist items, issuing page requests concurrently.
+
+    The first page establishes ``total`` unless the caller already knows it
+    (e.g. from a ``tracks.total`` probe), in which case every page including
+    the first is fetched in parallel. Pages are concatenated in offset order,
+    turning O(pages) sequential round trips into roughly one.
+
+    Note: ``fields`` must request ``total`` at the top level.
+    """
+    semaphore = asyncio.Semaphore(_PAGE_CONCURRENCY)
+
+    async def fetch_page(offset: int) -> Dict[str, Any]:
+        async with semaphore:
+            return await run_in_threadpool(
+                sp.playlist_items, playlist_id, limit=_PAGE_LIMIT, offset=offset, fields=fields
+            )
+
+    if known_total is not None:
+        offsets = range(0, max(known_total, 1), _PAGE_LIMIT)
+        pages = await asyncio.gather(*(fetch_page(offset) for offset in offsets))
+        items: List[Dict[str, Any]] = []
+        for page in pages:
+            items.extend(page.get("items", []) or [])
+        return items
+
+    first = await run_in_threadpool(
+        sp.playlist_items, playlist_id, limit=_PAGE_LIMIT, offset=0, fields=fields
+    )
+    items = list(first.get("items", []) or [])
+    total = first.get("total") or len(items)
+    remaining = range(_PAGE_LIMIT, total, _PAGE_LIMIT)
+    if remaining:
+        pages = await asyncio.gather(*(fetch_page(offset) for offset in remaining))
+        for page in pages:
+            items.extend(page.get("items", []) or [])
     return items
 
 
+# Writes fan out less aggressively than reads to avoid 429s.
+_ADD_CONCURRENCY = 4
+
+
+async def _add_items_in_batches(sp: Any, playlist_id: str, track_uris: List[str]) -> None:
+    """Add tracks in 100-URI batches, issuing the batch requests concurrently."""
+    batches = [track_uris[i:i + 100] for i in range(0, len(track_uris), 100)]
+    if not batches:
+        return
+    semaphore = asyncio.Semaphore(_ADD_CONCURRENCY)
+
+    async def add_batch(batch: List[str]) -> None:
+        async with semaphore:
+            await run_in_threadpool(sp.playlist_add_items, playlist_id, batch)
+
+    await asyncio.gather(*(add_batch(batch) for batch in batches))
+
+
+def _index_uri_positions(items: List[Dict[str, Any]], wanted: set) -> Dict[str, List[int]]:
+    """
+    Build a URI -> ascending positions index for the requested URIs.
+
+    Factored out of the removal path so the per-item work is a single tight
+    loop with bound locals - this runs once per playlist item and shows up
+    on profiles for multi-thousand-track removals.
+    """
+    if not wanted:
+        return {}
+    positions_map: Dict[str, List[int]] = {uri: [] for uri in wanted}
+    get_positions = positions_map.get
+    for idx, track_item in enumerate(items):
+        track = track_item.get("track")
+        uri = track.get("uri") if track else None
+        positions = get_positions(uri)
+        if positions is not None:
+            positions.append(idx)
+    return positions_map
+
+
+async def _fetch_playlist_items(sp: Any, playlist_id: str) -> List[Dict[str, Any]]:
+    """Fetch all playlist items with parallel pagination."""
+    return await _gather_playlist_pages(sp, playlist_id, fields=_PLAYLIST_ITEMS_FULL_FIELDS)
+
+
 @router.post("/{playlist_id}/clone")
 async def clone_playlist(
     playlist_id: str,
@@ -534,29 +759,24 @@ async def clone_playlist(
           "Cloning playlist %s for user=%s with name=%s public=%s collaborative=%s",
           playlist_id, user_id, body.name, body.public, body.collaborative
         )
-        new_playlist = sp.user_playlist_create(
+        new_playlist = await run_in_threadpool(
+            sp.user_playlist_create,
             user=user_id,
             name=body.name,
             public=body.public,
             collaborative=body.collaborative,
             description=body.description,
         )
-        # fetch all tracks from source
-        track_uris = []
-        offset = 0
-        limit = 100
-        while True:
-            res = sp.playlist_items(playlist_id, limit=limit, offset=offset, fields="items(track(uri)),next")
-            for item in res.get("items", []):
-                uri = item.get("track", {}).get("uri")
-                if uri:
-                    track_uris.append(uri)
-            if res.get("next") is None:
-                break
-            offset += limit
-        # add to new playlist in batches
-        for i in range(0, len(track_uris), 100):
-            sp.playlist_add_items(new_playlist["id"], track_uris[i:i+100])
+        # fetch all tracks from source (pages fetched concurrently)
+        source_items = await _gather_playlist_pages(sp, playlist_id, fields=_PLAYLIST_ITEMS_URI_FIELDS)
+        track_uris = [
+            uri for item in source_items
+            if (uri := (item.get("track") or {}).get("uri"))
+        ]
+        if body.dedupe:
+            track_uris = list(dict.fromkeys(track_uris))
+        # add to new playlist in concurrent batches
+        await _add_items_in_batches(sp, new_playlist["id"], track_uris)
         logger.info("Cloned playlist %s to new id %s with %d tracks", playlist_id, new_playlist["id"], len(track_uris))
         return {"message": "Playlist cloned", "new_playlist_id": new_playlist["id"]}
     except Exception as e:
@@ -568,6 +788,7 @@ async def clone_playlist(
 async def add_tracks_to_playlist(
     playlist_id: str,
     body: PlaylistTrackAddRequest,
+    background: BackgroundTasks,
     session_mgr: SessionManager = Depends(require_auth),
     spotify: SpotifyService = Depends(get_spotify_service)
 ):
@@ -581,14 +802,18 @@ async def add_tracks_to_playlist(
     try:
         position = body.position
         inserted = 0
-        for i in range(0, len(track_uris), 100):
-            batch = track_uris[i:i + 100]
-            if position is not None:
-                sp.playlist_add_items(playlist_id, batch, position=position + inserted)
+        if position is not None:
+            # Positional inserts must stay serial: each batch's position
+            # depends on the previous batch having landed.
+            for i in range(0, len(track_uris), 100):
+                batch = track_uris[i:i + 100]
+                await run_in_threadpool(sp.playlist_add_items, playlist_id, batch, position=position + inserted)
                 inserted += len(batch)
-            else:
-                sp.playlist_add_items(playlist_id, batch)
-        playlist_cache_store.mark_dirty(playlist_id)
+        else:
+            await _add_items_in_batches(sp, playlist_id, track_uris)
+        # Cache invalidation is not needed for the response; commit it after
+        # the reply has gone out.
+        background.add_task(playlist_cache_store.mark_dirty, playlist_id)
         return {"message": "Tracks added", "added": len(track_uris)}
     except Exception as e:
         logger.error("Failed to add tracks to playlist %s: %s", playlist_id, e)
@@ -599,6 +824,7 @@ async def add_tracks_to_playlist(
 async def remove_tracks_from_playlist(
     playlist_id: str,
     body: PlaylistTrackRemoveRequest,
+    background: BackgroundTasks,
     session_mgr: SessionManager = Depends(require_auth),
     spotify: SpotifyService = Depends(get_spotify_service)
 ):
@@ -616,8 +842,11 @@ async def remove_tracks_from_playlist(
     )
 
     try:
-        # Fetch current playlist snapshot
-        current_snapshot = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+        # Fetch the current snapshot and track total in a single probe; the
+        # total sizes the page fan-out below without a full scan.
+        snapshot_info = await run_in_threadpool(sp.playlist, playlist_id, fields=_SNAPSHOT_TOTAL_FIELDS)
+        current_snapshot = snapshot_info.get("snapshot_id")
+        total_items = (snapshot_info.get("tracks") or {}).get("total", 0)
         if body.snapshot_id and body.snapshot_id != current_snapshot:
             logger.info(
                 "Snapshot mismatch for playlist %s: client=%s server=%s",
@@ -631,31 +860,25 @@ async def remove_tracks_from_playlist(
             # Build a map of current URIs to their actual positions (full playlist scan)
             requested_uris = {item.uri for item in items_with_positions if item.uri}
 
-            def collect_positions(target_uris):
-                positions_map = {uri: [] for uri in target_uris}
-                offset = 0
-                limit = 100
-                total = 0
-                while True:
-                    res = sp.playlist_items(
+            # Per-request memo of the playlist scan, keyed by snapshot so a
+            # re-resolution within this request reuses the pages instead of
+            # re-fetching. Cleared after any mutation.
+            pages_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+            async def collect_positions(target_uris):
+                cache_key = f"{playlist_id}:{current_snapshot}"
+                items = pages_cache.get(cache_key)
+                if items is None:
+                    items = await _gather_playlist_pages(
+                        sp,
                         playlist_id,
-                        limit=limit,
-                        offset=offset,
-                        fields="items(track(uri)),next"
+                        fields=_PLAYLIST_ITEMS_URI_FIELDS,
+                        known_total=total_items,
                     )
-                    items = res.get("items", [])
-                    total = offset + len(items)
-                    for idx, track_item in enumerate(items, start=offset):
-                        track = track_item.get("track") or {}
-                        uri = track.get("uri")
-                        if uri in positions_map:
-                            positions_map[uri].append(idx)
-                    if res.get("next") is None:
-                        break
-                    offset += limit
-                return positions_map, total
-
-            uri_to_positions, total_items = collect_positions(requested_uris)
+                    pages_cache[cache_key] = items
+                return _index_uri_positions(items, target_uris), len(items)
+
+            uri_to_positions, scanned_items = await collect_positions(requested_uris)
             before_counts = {uri: len(positions) for uri, positions in uri_to_positions.items()}
             logger.info(
                 "Resolved removal positions for playlist %s: total_items=%s, uris=%s",
@@ -671,23 +894,25 @@ async def remove_tracks_from_playlist(
             for item in items_with_positions:
                 positions = uri_to_positions.get(item.uri) or []
                 if positions:
-                    available = positions.copy()
                     # Find the closest available position to the requested one
-                    # This handles cases where the playlist has been modified since frontend loaded
-                    closest = min(available, key=lambda p: abs(p - item.position))
+                    # via bisect - positions are collected in ascending order.
+                    # This handles cases where the playlist has been modified
+                    # since the frontend loaded.
+                    insert_at = bisect_left(positions, item.position)
+                    candidates = [i for i in (insert_at - 1, insert_at) if 0 <= i < len(positions)]
+                    chosen_idx = min(candidates, key=lambda i: abs(positions[i] - item.position))
+                    # Pop so multiple selections of the same URI don't duplicate
+                    closest = positions.pop(chosen_idx)
                     logger.info(
-                        "Removal resolve for playlist %s uri=%s requested=%s available=%s chosen=%s",
+                        "Removal resolve for playlist %s uri=%s requested=%s chosen=%s",
                         playlist_id,
                         item.uri,
                         item.position,
-                        available,
                         closest
                     )
                     # Add this specific removal
                     payload_items.append({"uri": item.uri, "positions": [closest]})
                     positions_to_remove.append(closest)
-                    # Remove from available so if there are multiple selections of same URI, we don't duplicate
-                    uri_to_positions[item.uri].remove(closest)
                 else:
                     logger.warning(
                         "No positions found for removal in playlist %s uri=%s requested=%s",
@@ -697,7 +922,7 @@ async def remove_tracks_from_playlist(
                     )
             
             if positions_to_remove:
-                positions_to_remove = sorted(set(positions_to_remove), reverse=True)
+                positions_to_remove = sorted({*positions_to_remove}, reverse=True)
                 logger.info(
                     "Removing %s track(s) from playlist %s at positions=%s snapshot=%s",
                     len(positions_to_remove),
@@ -706,22 +931,28 @@ async def remove_tracks_from_playlist(
                     current_snapshot
                 )
                 remove_payload = {"positions": positions_to_remove, "snapshot_id": current_snapshot}
-                remove_result = sp._delete(f"playlists/{playlist_id}/tracks", payload=remove_payload)
+                remove_result = await run_in_threadpool(
+                    sp._delete, f"playlists/{playlist_id}/tracks", payload=remove_payload
+                )
                 logger.info(
                     "Removal response for playlist %s: %s",
                     playlist_id,
                     remove_result
                 )
-                after_positions, after_total = collect_positions(requested_uris)
-                after_counts = {uri: len(positions) for uri, positions in after_positions.items()}
-                logger.info(
-                    "Removal verification for playlist %s: before=%s after=%s total_before=%s total_after=%s",
-                    playlist_id,
-                    before_counts,
-                    after_counts,
-                    total_items,
-                    after_total
-                )
+                pages_cache.clear()
+                # The verification re-scan is purely diagnostic and costs a
+                # full playlist scan; only pay for it when debugging.
+                if logger.isEnabledFor(logging.DEBUG):
+                    after_positions, after_total = await collect_positions(requested_uris)
+                    after_counts = {uri: len(positions) for uri, positions in after_positions.items()}
+                    logger.debug(
+                        "Removal verification for playlist %s: before=%s after=%s total_before=%s total_after=%s",
+                        playlist_id,
+                        before_counts,
+                        after_counts,
+                        scanned_items,
+                        after_total
+                    )
                 removed_count = len(positions_to_remove)
             else:
                 removed_count = 0
@@ -729,14 +960,15 @@ async def remove_tracks_from_playlist(
             uris = list({item.uri for item in body.items if item.uri})
             if not uris:
                 return {"message": "No tracks selected", "removed": 0}
-            sp.playlist_remove_all_occurrences_of_items(
+            await run_in_threadpool(
+                sp.playlist_remove_all_occurrences_of_items,
                 playlist_id,
                 uris,
                 snapshot_id=current_snapshot
             )
             removed_count = len(uris)
 
-        playlist_cache_store.mark_dirty(playlist_id)
+        background.add_task(playlist_cache_store.mark_dirty, playlist_id)
         return {"message": "Tracks removed", "removed": removed_count}
     except Exception as e:
         logger.error("Failed to remove tracks from playlist %s: %s", playlist_id, e)
@@ -757,7 +989,8 @@ async def create_playlist_from_tracks(
     try:
         payload_public = body.public
         payload_collab = body.collaborative if payload_public is False else False
-        new_playlist = sp.user_playlist_create(
+        new_playlist = await run_in_threadpool(
+            sp.user_playlist_create,
             user=user_id,
             name=body.name,
             public=payload_public,
@@ -765,8 +998,7 @@ async def create_playlist_from_tracks(
             description=body.description,
         )
         track_uris = [uri for uri in body.track_uris if uri]
-        for i in range(0, len(track_uris), 100):
-            sp.playlist_add_items(new_playlist["id"], track_uris[i:i + 100])
+        await _add_items_in_batches(sp, new_playlist["id"], track_uris)
         return {"message": "Playlist created", "new_playlist_id": new_playlist["id"]}
     except Exception as e:
         logger.error("Failed to create playlist for user %s: %s", user_id, e)
@@ -792,13 +1024,16 @@ async def get_playlist_cache_matches_batch(
     """Return cache-only match summaries for multiple playlists."""
     tracks = body.tracks or []
     results: List[Dict[str, Any]] = []
+    # One cutoff for the whole batch instead of a clock read and ISO format
+    # per playlist.
+    cutoff = _track_cache_cutoff()
     for playlist_id in [pid for pid in body.playlist_ids if pid]:
-        summary = _get_cached_match(playlist_id, tracks, include_matches=False)
+        summary = _get_cached_match(playlist_id, tracks, include_matches=False, cutoff=cutoff)
         results.append({"playlist_id": playlist_id, **summary})
     return {"results": results}
 
 
-@router.post("/{playlist_id}/duplicates/analyze")
+@router.post("/{playlist_id}/duplicates/analyze", response_class=ORJSONResponse)
 async def analyze_duplicates(
     playlist_id: str,
     include_similar: bool = False,
@@ -818,129 +1053,135 @@ async def analyze_duplicates(
     if session_id:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT track_id_1, track_id_2 FROM ignored_pairs
-                WHERE session_id = ? AND (playlist_id = ? OR playlist_id IS NULL)
-            """, (session_id, playlist_id))
-            for row in cursor.fetchall():
-                ignored_pairs.add((row['track_id_1'], row['track_id_2']))
+            cursor.execute(_IGNORED_PAIRS_SQL, (session_id, playlist_id))
+            ignored_pairs = {(row['a'], row['b']) for row in cursor.fetchall()}
     
     try:
-        snapshot_info = sp.playlist(playlist_id, fields="snapshot_id")
+        # The snapshot probe and the item scan are independent reads; overlap
+        # them instead of paying the probe's round trip up front.
+        snapshot_info, items = await asyncio.gather(
+            run_in_threadpool(sp.playlist, playlist_id, fields=_SNAPSHOT_FIELDS),
+            _fetch_playlist_items(sp, playlist_id),
+        )
         snapshot_id = snapshot_info.get("snapshot_id")
-        items = _fetch_playlist_items(sp, playlist_id)
-        groups: Dict[str, Dict[str, Any]] = {}
-        seen_keys: Dict[str, List[int]] = {}
-
-        def album_pref_score(album: Dict[str, Any]) -> int:
-            a_type = (album or {}).get("album_type") or ""
-            score_map = {"album": 3, "single": 2, "compilation": 1}
-            return score_map.get(a_type, 0)
 
+        # Pass 1: cheap scan that only assigns each track to a match key and
+        # counts track ids per key. The full occurrence payload (artist
+        # projections, album images, ...) is deferred to pass 2, which only
+        # runs for keys that actually have duplicates - on a typical playlist
+        # that skips the expensive dict build for ~98% of tracks.
+        key_positions: Dict[str, List[int]] = {}
+        key_tid_counts: Dict[str, Dict[str, int]] = {}
         for idx, item in enumerate(items):
             track = item.get("track") or {}
             track_id = track.get("id")
             if not track_id:
                 continue
-            album = track.get("album") or {}
-            norm_title = _normalize_title(track.get("name", ""))
-            norm_artist = _normalize_artist((track.get("artists") or [{}])[0].get("name", ""))
-            key = track_id
-            reason = "exact"
-            duration = track.get("duration_ms") or 0
             if include_similar:
-                key = f"{norm_title}::{norm_artist}"
-                existing_group = groups.get(key)
-                if existing_group and any(o.get("track_id") == track_id for o in existing_group.get("occurrences", [])):
-                    reason = "exact"
+                artists_list = track.get("artists") or []
+                first_artist = artists_list[0].get("name", "") if artists_list else ""
+                key = f"{_normalize_title(track.get('name', ''))}::{_normalize_artist(first_artist)}"
+            else:
+                key = track_id
+            positions = key_positions.get(key)
+            if positions is None:
+                key_positions[key] = [idx]
+                key_tid_counts[key] = {track_id: 1}
+            else:
+                positions.append(idx)
+                counts = key_tid_counts[key]
+                counts[track_id] = counts.get(track_id, 0) + 1
+
+        # Pass 2: materialize occurrences for duplicate keys only. Slotted
+        # msgspec structs keep per-object overhead a fraction of a dict's and
+        # encode faster on the response path.
+        duplicate_groups: List[DuplicateGroup] = []
+        for key, positions in key_positions.items():
+            if len(positions) < 2:
+                continue
+            counts = key_tid_counts[key]
+            group: Optional[DuplicateGroup] = None
+            occurrences: List[DuplicateOccurrence] = []
+            for idx in positions:
+                item = items[idx]
+                track = item.get("track") or {}
+                track_id = track.get("id")
+                album = track.get("album") or {}
+                # Extract the four artist projections in one pass; the
+                # occurrence dict and the group header share them.
+                artists_list = track.get("artists") or []
+                artist_names: List[Optional[str]] = []
+                artist_ids: List[Optional[str]] = []
+                artist_uris: List[Optional[str]] = []
+                artist_urls: List[Optional[str]] = []
+                for a in artists_list:
+                    artist_names.append(a.get("name"))
+                    artist_ids.append(a.get("id"))
+                    artist_uris.append(a.get("uri"))
+                    artist_urls.append((a.get("external_urls") or {}).get("spotify"))
+                if include_similar:
+                    # A track id repeated within the group is an exact dupe;
+                    # a unique id matched the group only by similarity.
+                    reason = "exact" if counts.get(track_id, 0) > 1 else "similar"
                 else:
-                    prior_durations = seen_keys.get(key, [])
-                    if prior_durations:
-                        reason = "similar" if any(abs(duration - d) < 2000 for d in prior_durations) else "similar"
-                    else:
-                        reason = "similar"
-                seen_keys.setdefault(key, []).append(duration)
-            if not include_similar:
-                # exact matching also needs seen to mark duplicates
-                if key in seen_keys:
                     reason = "exact"
-                seen_keys.setdefault(key, []).append(duration)
-
-            album_type = album.get("album_type")
-            album_total_tracks = album.get("total_tracks")
-            album_release_date = album.get("release_date")
-            album_release_date_precision = album.get("release_date_precision")
-            occ = {
-                "uri": track.get("uri"),
-                "position": idx,
-                "added_at": item.get("added_at"),
-                "added_by": (item.get("added_by") or {}).get("id"),
-                "name": track.get("name"),
-                "artists": [a.get("name") for a in (track.get("artists") or [])],
-                "artist_ids": [a.get("id") for a in (track.get("artists") or [])],
-                "artist_uris": [a.get("uri") for a in (track.get("artists") or [])],
-                "artist_external_urls": [a.get("external_urls", {}).get("spotify") for a in (track.get("artists") or [])],
-                "album": (track.get("album") or {}).get("name"),
-                "album_id": album.get("id"),
-                "album_uri": album.get("uri"),
-                "album_external_url": album.get("external_urls", {}).get("spotify"),
-                "album_images": (track.get("album") or {}).get("images") or [],
-                "duration_ms": track.get("duration_ms"),
-                "reason": reason if reason in ("exact", "similar") else "exact",
-                "track_id": track_id,
-                "album_type": album_type,
-                "album_total_tracks": album_total_tracks,
-                "album_release_date": album_release_date,
-                "album_release_date_precision": album_release_date_precision,
-                "album_preference_score": album_pref_score(album) if prefer_album_release else 0,
-            }
-            if key not in groups:
-                groups[key] = {
-                    "track_id": track_id,
-                    "track_uri": track.get("uri"),
-                    "name": track.get("name"),
-                    "artists": [a.get("name") for a in (track.get("artists") or [])],
-                    "artist_ids": [a.get("id") for a in (track.get("artists") or [])],
-                    "artist_uris": [a.get("uri") for a in (track.get("artists") or [])],
-                    "artist_external_urls": [a.get("external_urls", {}).get("spotify") for a in (track.get("artists") or [])],
-                    "album": album.get("name"),
-                    "album_id": album.get("id"),
-                    "album_uri": album.get("uri"),
-                    "album_external_url": album.get("external_urls", {}).get("spotify"),
-                    "album_images": album.get("images") or [],
-                    "occurrences": [],
-                    "match_key": key,
-                    "track_ids": set(),
-                }
-            groups[key]["track_ids"].add(track_id)
-            groups[key]["occurrences"].append(occ)
-            # If in similar mode and we find multiple entries with the same track_id inside this group, mark them as exact.
-            if include_similar and len(groups[key]["track_ids"]) < len(groups[key]["occurrences"]):
-                track_id_counts = {}
-                for o in groups[key]["occurrences"]:
-                    tid = o.get("track_id")
-                    if tid:
-                        track_id_counts[tid] = track_id_counts.get(tid, 0) + 1
-                for o in groups[key]["occurrences"]:
-                    if o.get("track_id") and track_id_counts.get(o["track_id"], 0) > 1:
-                        o["reason"] = "exact"
-
-        duplicate_groups = [g for g in groups.values() if len(g["occurrences"]) > 1]
+                occurrences.append(DuplicateOccurrence(
+                    uri=track.get("uri"),
+                    position=idx,
+                    added_at=item.get("added_at"),
+                    added_by=(item.get("added_by") or {}).get("id"),
+                    name=track.get("name"),
+                    artists=artist_names,
+                    artist_ids=artist_ids,
+                    artist_uris=artist_uris,
+                    artist_external_urls=artist_urls,
+                    album=album.get("name"),
+                    album_id=album.get("id"),
+                    album_uri=album.get("uri"),
+                    album_external_url=album.get("external_urls", {}).get("spotify"),
+                    album_images=album.get("images") or [],
+                    duration_ms=track.get("duration_ms"),
+                    reason=reason,
+                    track_id=track_id,
+                    album_type=album.get("album_type"),
+                    album_total_tracks=album.get("total_tracks"),
+                    album_release_date=album.get("release_date"),
+                    album_release_date_precision=album.get("release_date_precision"),
+                    album_preference_score=_album_pref_score(album) if prefer_album_release else 0,
+                ))
+                if group is None:
+                    group = DuplicateGroup(
+                        track_id=track_id,
+                        track_uri=track.get("uri"),
+                        name=track.get("name"),
+                        artists=artist_names,
+                        artist_ids=artist_ids,
+                        artist_uris=artist_uris,
+                        artist_external_urls=artist_urls,
+                        album=album.get("name"),
+                        album_id=album.get("id"),
+                        album_uri=album.get("uri"),
+                        album_external_url=album.get("external_urls", {}).get("spotify"),
+                        album_images=album.get("images") or [],
+                        occurrences=occurrences,
+                        match_key=key,
+                        track_ids=list(counts),
+                    )
+            if group is not None:
+                duplicate_groups.append(group)
         
         # Filter out ignored pairs
         filtered_groups = []
         for g in duplicate_groups:
             # Check if this is an ignored pair (for 2-occurrence groups only)
-            if len(g["occurrences"]) == 2:
-                track_ids = sorted([g["occurrences"][0]["track_id"], g["occurrences"][1]["track_id"]])
-                if tuple(track_ids) in ignored_pairs:
+            if len(g.occurrences) == 2:
+                tid_a = g.occurrences[0].track_id
+                tid_b = g.occurrences[1].track_id
+                if (min(tid_a, tid_b), max(tid_a, tid_b)) in ignored_pairs:
                     continue  # Skip this pair
-            
-            # Convert track_ids set to list for JSON serialization
-            g["track_ids"] = list(g["track_ids"])
             filtered_groups.append(g)
-        
-        total_extra = sum(len(g["occurrences"]) - 1 for g in filtered_groups)
+
+        total_extra = sum(len(g.occurrences) - 1 for g in filtered_groups)
         logger.info(
             "Duplicate analysis for playlist %s (user=%s): %s groups, %s extra occurrences (include_similar=%s, prefer_album_release=%s, ignored=%s)",
             playlist_id,
@@ -951,12 +1192,17 @@ async def analyze_duplicates(
             prefer_album_release,
             len(ignored_pairs),
         )
-        return {
-            "snapshot_id": snapshot_id,
-            "total_groups": len(filtered_groups),
-            "total_extra": total_extra,
-            "groups": filtered_groups
-        }
+        # Encode with msgspec directly - it serializes the slotted structs
+        # natively, so neither jsonable_encoder nor a dict conversion runs.
+        return Response(
+            content=msgspec.json.encode({
+                "snapshot_id": snapshot_id,
+                "total_groups": len(filtered_groups),
+                "total_extra": total_extra,
+                "groups": filtered_groups,
+            }),
+            media_type="application/json",
+        )
     except Exception as e:
         logger.error("Failed to analyze duplicates for playlist %s: %s", playlist_id, e)
         raise HTTPException(status_code=500, detail="Failed to analyze duplicates")
@@ -976,9 +1222,17 @@ async def remove_duplicates(
     if not sp:
         raise HTTPException(status_code=401, detail="Spotify authentication expired")
     try:
-        # Recompute current items to ensure positions are accurate and filter out stale selections
-        current_items = _fetch_playlist_items(sp, playlist_id)
-        current_snapshot = body.snapshot_id or sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+        # Recompute current items to ensure positions are accurate and filter
+        # out stale selections; the snapshot probe runs concurrently when the
+        # client did not supply one.
+        if body.snapshot_id:
+            current_items = await _fetch_playlist_items(sp, playlist_id)
+            current_snapshot = body.snapshot_id
+        else:
+            current_items, current_snapshot = await asyncio.gather(
+                _fetch_playlist_items(sp, playlist_id),
+                run_in_threadpool(_probe_snapshot, sp, playlist_id),
+            )
 
         logger.info(
             "Duplicate removal request: %s items for playlist %s (user=%s) snapshot=%s",
@@ -1009,21 +1263,25 @@ async def remove_duplicates(
             logger.info("No valid duplicate occurrences to remove for playlist %s", playlist_id)
             return {"message": "No duplicates removed", "removed": 0}
 
-        # Capture details for undo before we delete anything
+        # Capture details for undo before we delete anything. Dedupe and
+        # range-check in one set build, sort once ascending for extraction,
+        # then reverse in place for the delete payload instead of re-sorting.
+        total = len(current_items)
+        positions_to_remove = sorted({p for p in positions_to_remove if 0 <= p < total})
         removed_items = []
-        for pos in sorted(set(positions_to_remove)):
-            if 0 <= pos < len(current_items):
-                track = (current_items[pos] or {}).get("track") or {}
-                removed_items.append({
-                    "uri": track.get("uri"),
-                    "position": pos,
-                    "name": track.get("name"),
-                    "artists": [a.get("name") for a in (track.get("artists") or [])],
-                    "album": (track.get("album") or {}).get("name"),
-                    "added_at": current_items[pos].get("added_at"),
-                })
-
-        positions_to_remove = sorted(positions_to_remove, reverse=True)
+        for pos in positions_to_remove:
+            item = current_items[pos] or {}
+            track = item.get("track") or {}
+            removed_items.append({
+                "uri": track.get("uri"),
+                "position": pos,
+                "name": track.get("name"),
+                "artists": [a.get("name") for a in (track.get("artists") or [])],
+                "album": (track.get("album") or {}).get("name"),
+                "added_at": item.get("added_at"),
+            })
+
+        positions_to_remove.reverse()
 
         logger.info(
             "Removing %s occurrences by position for playlist %s (user=%s) snapshot=%s",
@@ -1036,12 +1294,15 @@ async def remove_duplicates(
 
         # Use positions-only delete to mirror spotify-dedup approach
         payload = {"positions": positions_to_remove, "snapshot_id": current_snapshot}
-        sp._delete(f"playlists/{playlist_id}/tracks", payload=payload)
+        await run_in_threadpool(sp._delete, f"playlists/{playlist_id}/tracks", payload=payload)
+        _invalidate_snapshot_probe(playlist_id)
 
         # Verify removal by refetching count
-        after_items = _fetch_playlist_items(sp, playlist_id)
+        after_items, after_snapshot = await asyncio.gather(
+            _fetch_playlist_items(sp, playlist_id),
+            run_in_threadpool(_probe_snapshot, sp, playlist_id),
+        )
         removed_count = len(current_items) - len(after_items)
-        after_snapshot = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
 
         try:
             op_store.cleanup_expired()
@@ -1086,7 +1347,7 @@ async def undo_last_operation(
         raise HTTPException(status_code=404, detail="No undoable operations found for this playlist")
 
     try:
-        current_snapshot = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+        current_snapshot = await run_in_threadpool(_probe_snapshot, sp, playlist_id)
         expected_snapshot = op.get("snapshot_after")
         if expected_snapshot and current_snapshot and current_snapshot != expected_snapshot:
             logger.warning(
@@ -1108,14 +1369,35 @@ async def undo_last_operation(
                 raise HTTPException(status_code=400, detail="No removal data stored for undo.")
 
             # Insert back in ascending position order to restore layout.
-            for item in sorted(removed_items, key=lambda x: x.get("position", 0)):
-                uri = item.get("uri")
-                position = item.get("position")
-                if not uri:
+            # Contiguous position runs collapse into one bulk add (<=100 URIs)
+            # per run, so a typical undo is a handful of calls instead of one
+            # round trip per track. Runs stay sequential: each insert shifts
+            # every later index, so disjoint runs cannot be issued in parallel.
+            restorable = [
+                (item["position"], item["uri"])
+                for item in removed_items
+                if item.get("uri") and item.get("position") is not None
+            ]
+            restorable.sort()
+            run_start: Optional[int] = None
+            run_uris: List[str] = []
+            for position, uri in restorable:
+                if run_uris and position == run_start + len(run_uris) and len(run_uris) < 100:
+                    run_uris.append(uri)
                     continue
-                sp.playlist_add_items(playlist_id, [uri], position=position)
+                if run_uris:
+                    await run_in_threadpool(
+                        sp.playlist_add_items, playlist_id, run_uris, position=run_start
+                    )
+                run_start = position
+                run_uris = [uri]
+            if run_uris:
+                await run_in_threadpool(
+                    sp.playlist_add_items, playlist_id, run_uris, position=run_start
+                )
 
-            new_snapshot = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+            _invalidate_snapshot_probe(playlist_id)
+            new_snapshot = await run_in_threadpool(_probe_snapshot, sp, playlist_id)
             op_store.mark_undone(op["id"])
             logger.info(
                 "Undo duplicates_remove for playlist %s (user=%s) restored %s tracks",
@@ -1144,11 +1426,12 @@ async def undo_last_operation(
                 if not first_batch:
                     raise HTTPException(status_code=400, detail="Stored sort order is empty.")
 
-                sp.playlist_replace_items(playlist_id, first_batch)
+                await run_in_threadpool(sp.playlist_replace_items, playlist_id, first_batch)
                 for i in range(0, len(rest), 100):
-                    sp.playlist_add_items(playlist_id, rest[i:i+100])
+                    await run_in_threadpool(sp.playlist_add_items, playlist_id, rest[i:i+100])
 
-                new_snapshot = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+                _invalidate_snapshot_probe(playlist_id)
+                new_snapshot = await run_in_threadpool(_probe_snapshot, sp, playlist_id)
                 op_store.mark_undone(op["id"])
                 logger.info(
                     "Undo sort_reorder for playlist %s (user=%s) restored previous order (%s tracks)",
@@ -1175,7 +1458,7 @@ async def undo_last_operation(
         raise HTTPException(status_code=500, detail="Failed to undo last operation")
 
 
-@router.get("/{playlist_id}/history")
+@router.get("/{playlist_id}/history", response_class=ORJSONResponse)
 async def get_playlist_history(
     playlist_id: str,
     session_mgr: SessionManager = Depends(require_auth),
@@ -1190,7 +1473,7 @@ async def get_playlist_history(
     try:
         sp = spotify.get_spotify_client(session_mgr.get_user_id())
         if sp:
-            current_snapshot = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+            current_snapshot = await run_in_threadpool(_probe_snapshot, sp, playlist_id)
     except Exception as e:
         logger.warning("Failed to fetch current snapshot for history state: %s", e)
 
@@ -1224,7 +1507,7 @@ async def get_playlist_history(
             "source": payload.get("source"),
             "schedule_id": payload.get("schedule_id"),
         })
-    return {"history": cleaned}
+    return ORJSONResponse({"history": cleaned})
 
 
 @router.get("/{playlist_id}/history/{operation_id}/export")
@@ -1246,31 +1529,34 @@ async def export_history(
     if not removed_items:
         raise HTTPException(status_code=400, detail="No removed items to export")
 
-    export_payload = {
+    header = {
         "playlist_id": playlist_id,
         "operation_id": operation_id,
         "op_type": op.get("op_type"),
         "created_at": op.get("created_at"),
         "snapshot_before": op.get("snapshot_before"),
         "snapshot_after": op.get("snapshot_after"),
-        "removed_items": [],
     }
-    for item in removed_items:
-        export_payload["removed_items"].append({
-            "title": (item.get("name") or "").strip(),
-            "artists": item.get("artists") or [],
-            "album": (item.get("album") or "").strip(),
-            "added_at": item.get("added_at") or "",
-            "uri": item.get("uri") or "",
-        })
+
+    # Stream the export instead of materializing one big indented string, so
+    # peak memory stays flat regardless of how many items were removed.
+    def generate():
+        yield orjson.dumps(header)[:-1] + b',"removed_items":['
+        for i, item in enumerate(removed_items):
+            chunk = orjson.dumps({
+                "title": (item.get("name") or "").strip(),
+                "artists": item.get("artists") or [],
+                "album": (item.get("album") or "").strip(),
+                "added_at": item.get("added_at") or "",
+                "uri": item.get("uri") or "",
+            })
+            yield b"," + chunk if i else chunk
+        yield b"]}"
+
     headers = {"Content-Disposition": f'attachment; filename="removed-{operation_id}.json"'}
-    return StreamingResponse(
-        iter([json.dumps(export_payload, indent=2)]),
-        media_type="application/json",
-        headers=headers
-    )
+    return StreamingResponse(generate(), media_type="application/json", headers=headers)
 
-@router.get("/history/all")
+@router.get("/history/all", response_class=ORJSONResponse)
 async def get_all_user_history(
     session_mgr: SessionManager = Depends(require_auth),
     spotify: SpotifyService = Depends(get_spotify_service),
@@ -1278,18 +1564,30 @@ async def get_all_user_history(
     """Return recent operations across ALL playlists for this user."""
     op_store.cleanup_expired()
     history = op_store.get_all_history(session_mgr.get_user_id(), limit=50)
-    
-    # Get user's playlists for names
-    sp = spotify.get_spotify_client(session_mgr.get_user_id())
-    playlist_names = {}
-    if sp:
-        try:
-            playlists = sp.current_user_playlists(limit=50)
-            for p in playlists.get('items', []):
-                playlist_names[p['id']] = p['name']
-        except Exception as e:
-            logger.warning("Failed to fetch playlist names for history: %s", e)
-    
+
+    # Resolve names from the local cache keyed by the ids actually present in
+    # the history. The old first-page-of-playlists fetch both cost a network
+    # round trip and mislabelled anything beyond the first 50 playlists.
+    pids = {entry.get("playlist_id") for entry in history if entry.get("playlist_id")}
+    playlist_names = playlist_cache_store.get_names(pids)
+    missing = pids - playlist_names.keys()
+    if missing and len(missing) <= 5:
+        sp = spotify.get_spotify_client(session_mgr.get_user_id())
+        if sp:
+            async def fetch_name(pid: str) -> None:
+                try:
+                    meta = await run_in_threadpool(sp.playlist, pid, fields="name")
+                    if meta and meta.get("name"):
+                        playlist_names[pid] = meta["name"]
+                except Exception as e:
+                    logger.warning("Failed to fetch playlist name for history (%s): %s", pid, e)
+
+            await asyncio.gather(*(fetch_name(pid) for pid in missing))
+            if playlist_names:
+                playlist_cache_store.upsert_names(
+                    {pid: playlist_names[pid] for pid in missing if pid in playlist_names}
+                )
+
     # Format history entries
     cleaned = []
     for entry in history:
@@ -1321,8 +1619,8 @@ async def get_all_user_history(
             "source": payload.get("source"),
             "schedule_id": payload.get("schedule_id"),
         })
-    
-    return cleaned
+
+    return ORJSONResponse(cleaned)
 
 @router.delete("/{playlist_id}")
 async def delete_playlist(
@@ -1371,21 +1669,34 @@ else:
     handler.setFormatter(AdelaideFormatter("%(asctime)s - uvicorn.access - %(levelname)s - %(message)s"))
     uvicorn_access_logger.addHandler(handler)
 uvicorn_access_logger.propagate = False
+
+
+# Precompiled once: _normalize_title runs per track in duplicate analysis and
+# cache matching, where per-call re.sub pattern lookups add up.
+_PAREN_RE = re.compile(r"\([^)]*\)")
+_BRACKET_RE = re.compile(r"\[[^\]]*\]")
+_DASH_RE = re.compile(r"\s+-\s+.*")
+
+
+# The three helpers below are pure string transforms, and batch cache
+# matching normalizes the same titles/artists repeatedly across playlists,
+# so memoizing them turns repeat work into a dict hit.
+@lru_cache(maxsize=16384)
 def _normalize_title(title: str) -> str:
     """Normalize track title for similarity detection."""
     if not title:
         return ''
     title = title.lower()
     # Remove parenthetical/bracketed content
-    import re
-    title = re.sub(r"\([^)]*\)", "", title)
-    title = re.sub(r"\[[^\]]*\]", "", title)
+    title = _PAREN_RE.sub("", title)
+    title = _BRACKET_RE.sub("", title)
     # Remove feat/featuring segments
-    title = re.sub(r"\s+-\s+.*", "", title)
+    title = _DASH_RE.sub("", title)
     title = title.replace("feat.", "").replace("featuring", "").strip()
     return " ".join(title.split())
 
 
+@lru_cache(maxsize=16384)
 def _normalize_artist(name: str) -> str:
     if not name:
         return ''
@@ -1397,6 +1708,7 @@ def _normalize_artist(name: str) -> str:
     return " ".join(name.split())
 
 
+@lru_cache(maxsize=16384)
 def _build_similarity_key(title: str, artist: str) -> Optional[str]:
     norm_title = _normalize_title(title)
     norm_artist = _normalize_artist(artist)
@@ -1405,18 +1717,58 @@ def _build_similarity_key(title: str, artist: str) -> Optional[str]:
     return f"{norm_title}::{norm_artist}"
 
 
+def _track_cache_cutoff() -> str:
+    """ISO timestamp before which cached track rows count as stale."""
+    return (datetime.now(timezone.utc) - timedelta(days=settings.track_cache_ttl_days)).isoformat()
+
+
+# In-process memo of each playlist's similarity-key -> durations map, used as
+# a pre-filter so client tracks that definitely miss the playlist short-circuit
+# without re-normalizing the cached rows on every request. Entries are keyed by
+# the playlist's cache-facts validity token and rebuilt when it changes.
+_SIMILARITY_MAP_CACHE: Dict[str, Any] = {}
+_SIMILARITY_MAP_CACHE_MAX = 256
+
+
+def _get_similarity_map(playlist_id: str, cutoff: str, validity: Any) -> Dict[str, array]:
+    token = (validity, cutoff[:10])
+    cached = _SIMILARITY_MAP_CACHE.get(playlist_id)
+    if cached and cached[0] == token:
+        return cached[1]
+    key_map: Dict[str, Any] = {}
+    for row in playlist_cache_store.get_cached_playlist_tracks(playlist_id, cutoff):
+        try:
+            # artists_json is NOT NULL; orjson keeps the per-row parse in C.
+            artists = orjson.loads(row["artists_json"] or b"[]")
+        except orjson.JSONDecodeError:
+            artists = []
+        key = _build_similarity_key(row.get("name") or "", artists[0] if artists else "")
+        if key:
+            key_map.setdefault(key, []).append(row.get("duration_ms") or 0)
+    # Sorted once at build, the per-track duration-window test in the match
+    # loop becomes a bisect probe instead of a linear scan. array('i') packs
+    # the ints contiguously - these maps live in the cache across requests.
+    for key, durations in key_map.items():
+        durations.sort()
+        key_map[key] = array("i", durations)
+    if len(_SIMILARITY_MAP_CACHE) >= _SIMILARITY_MAP_CACHE_MAX:
+        _SIMILARITY_MAP_CACHE.clear()
+    _SIMILARITY_MAP_CACHE[playlist_id] = (token, key_map)
+    return key_map
+
+
 def _get_cached_match(
     playlist_id: str,
     tracks: List[PlaylistCacheMatchTrack],
     include_matches: bool,
+    cutoff: Optional[str] = None,
 ) -> Dict[str, Any]:
     total = len(tracks)
     cached_track_ids = playlist_cache_store.get_cached_track_ids(playlist_id)
+    facts = playlist_cache_store.get_facts_for_playlists([playlist_id]).get(playlist_id)
     if not cached_track_ids:
-        facts = playlist_cache_store.get_facts_for_playlists([playlist_id])
-        cached_flag = bool(facts.get(playlist_id))
         result: Dict[str, Any] = {
-            "cached": cached_flag,
+            "cached": bool(facts),
             "exact_count": 0,
             "similar_count": 0,
             "total": total,
@@ -1427,34 +1779,21 @@ def _get_cached_match(
             ]
         return result
 
-    cached_set = set(cached_track_ids)
-    requested_keys = set()
-    for track in tracks:
-        artist_name = (track.artists or [None])[0] if track.artists else None
-        key = _build_similarity_key(track.name or "", artist_name or "")
-        if key:
-            requested_keys.add(key)
-
-    similar_map: Dict[str, List[int]] = {}
-    if requested_keys:
-        cutoff = (datetime.now(timezone.utc) - timedelta(days=settings.track_cache_ttl_days)).isoformat()
-        cached_rows = playlist_cache_store.get_cached_playlist_tracks(playlist_id, cutoff)
-        for row in cached_rows:
-            try:
-                artists = json.loads(row.get("artists_json") or "[]")
-            except json.JSONDecodeError:
-                artists = []
-            artist_name = artists[0] if artists else ""
-            key = _build_similarity_key(row.get("name") or "", artist_name)
-            if key and key in requested_keys:
-                similar_map.setdefault(key, []).append(row.get("duration_ms") or 0)
+    cached_set = frozenset(cached_track_ids)
+    similar_map: Dict[str, array] = {}
+    if any(track.name for track in tracks):
+        if cutoff is None:
+            cutoff = _track_cache_cutoff()
+        validity = (facts.get("last_cached_at_utc"), facts.get("is_dirty")) if facts else None
+        similar_map = _get_similarity_map(playlist_id, cutoff, validity)
 
     exact_count = 0
     similar_count = 0
     matches: List[Dict[str, Optional[str]]] = []
+    in_cache = cached_set.__contains__  # bound once; probed per track
     for track in tracks:
         status = None
-        if track.track_id and track.track_id in cached_set:
+        if track.track_id and in_cache(track.track_id):
             status = "exact"
             exact_count += 1
         else:
@@ -1462,11 +1801,12 @@ def _get_cached_match(
             key = _build_similarity_key(track.name or "", artist_name or "")
             durations = similar_map.get(key) if key else None
             if durations and track.duration_ms is not None:
-                for duration in durations:
-                    if abs(track.duration_ms - duration) < 2000:
-                        status = "similar"
-                        similar_count += 1
-                        break
+                # abs(d - duration_ms) < 2000 over a sorted list: probe the
+                # window's lower bound and check the one candidate there.
+                lo = bisect_left(durations, track.duration_ms - 1999)
+                if lo < len(durations) and durations[lo] <= track.duration_ms + 1999:
+                    status = "similar"
+                    similar_count += 1
         if include_matches:
             matches.append({"client_key": track.client_key, "status": status})
 
@@ -1481,7 +1821,58 @@ def _get_cached_match(
     return result
 
 
-@router.post("/tracks/batch")
+@dataclass(slots=True)
+class _TrackBatchItem:
+    """One row of the batch track response; orjson serializes it natively,
+    and slots keep per-instance overhead off batches of up to 500."""
+    id: str
+    name: str
+    artists: List[Dict[str, str]]
+    album: Dict[str, Any]
+    duration_ms: int
+    uri: str
+    album_art: Optional[str]
+
+
+def _format_api_track(track: Dict[str, Any]) -> _TrackBatchItem:
+    """Shape a Spotify API track object for the batch response."""
+    album = track['album']
+    images = album.get('images')
+    return _TrackBatchItem(
+        id=track['id'],
+        name=track['name'],
+        artists=[{'name': artist['name']} for artist in track.get('artists', [])],
+        album={
+            'name': album['name'],
+            'images': images or [],
+            'release_date': album.get('release_date'),
+            'release_date_precision': album.get('release_date_precision')
+        },
+        duration_ms=track.get('duration_ms', 0),
+        uri=track['uri'],
+        album_art=images[0]['url'] if images else None,
+    )
+
+
+def _format_cached_track(track: Dict[str, Any]) -> "_TrackBatchItem":
+    """Shape a cache row for the batch response."""
+    return _TrackBatchItem(
+        id=track['id'],
+        name=track['name'],
+        artists=[{'name': name} for name in track['artists']],
+        album={
+            'name': track['album'],
+            'images': [],
+            'release_date': track.get('album_release_date'),
+            'release_date_precision': track.get('album_release_date_precision'),
+        },
+        duration_ms=track['duration_ms'],
+        uri=f"spotify:track:{track['id']}",
+        album_art=track.get('album_art_url'),
+    )
+
+
+@router.post("/tracks/batch", response_class=ORJSONResponse)
 async def get_tracks_batch(
     track_ids: List[str],
     session_mgr: SessionManager = Depends(require_auth),
@@ -1516,80 +1907,72 @@ async def get_tracks_batch(
             }
         ]
     """
-    from app.services.cache_service import CacheService
-    
     if not track_ids:
         return []
     
-    if len(track_ids) > 50:
+    if len(track_ids) > 500:
         raise HTTPException(
             status_code=400,
-            detail="Maximum 50 track IDs per request"
+            detail="Maximum 500 track IDs per request"
         )
-    
+
     try:
         session_id = session_mgr.session_id
-        
+
+        # Dedupe up front (order preserved) so repeated ids don't inflate the
+        # cache query or the Spotify fan-out; each id appears once in the
+        # response regardless of how often the caller repeated it.
+        if len(track_ids) > len(set(track_ids)):
+            track_ids = list(dict.fromkeys(track_ids))
+
         # Step 1: Check cache
         cached_tracks, missing_ids = CacheService.get_tracks(track_ids, session_id)
-        results = []
-        
-        # Step 2: Fetch missing tracks from Spotify
+        fetched_by_id: Dict[str, Dict[str, Any]] = {}
+
+        # Step 2: Fetch missing tracks from Spotify. The API caps tracks() at
+        # 50 ids, so fan the chunks out concurrently - wall time tracks the
+        # slowest chunk instead of the sum.
         if missing_ids:
             client = spotify.get_client()
-            tracks_data = client.tracks(list(missing_ids))
-            
-            fresh_tracks = []
-            for track in tracks_data.get('tracks', []):
-                if track is None:
-                    continue
-                fresh_tracks.append(track)
-                
-                # Format for response
-                results.append({
-                    'id': track['id'],
-                    'name': track['name'],
-                    'artists': [{'name': artist['name']} for artist in track.get('artists', [])],
-                    'album': {
-                        'name': track['album']['name'],
-                        'images': track['album'].get('images', []),
-                        'release_date': track['album'].get('release_date'),
-                        'release_date_precision': track['album'].get('release_date_precision')
-                    },
-                    'duration_ms': track.get('duration_ms', 0),
-                    'uri': track['uri'],
-                    'album_art': track['album']['images'][0]['url'] if track['album'].get('images') else None
-                })
-            
+            missing_list = list(missing_ids)
+            chunks = [missing_list[i:i + 50] for i in range(0, len(missing_list), 50)]
+            semaphore = asyncio.Semaphore(_PAGE_CONCURRENCY)
+
+            async def fetch_chunk(chunk: List[str]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await run_in_threadpool(client.tracks, chunk)
+
+            pages = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+            fetched: List[Dict[str, Any]] = []
+            for page in pages:
+                fetched.extend(page.get('tracks', []) or [])
+
+            fresh_tracks = [track for track in fetched if track is not None]
+            for track in fresh_tracks:
+                fetched_by_id[track['id']] = track
+
             # Step 3: Update cache with fresh data
             if fresh_tracks:
                 CacheService.set_tracks(fresh_tracks, session_id)
-        
-        # Step 4: Add cached tracks to results
+
+        # Step 4: Assemble results directly in request order - no intermediate
+        # unordered list plus id->result map just to reorder at the end.
+        # Bound lookups hoisted out of the loop; batches run up to 500 ids.
+        ordered_results = []
+        append_result = ordered_results.append
+        from_cache = cached_tracks.get
+        from_api = fetched_by_id.get
         for track_id in track_ids:
-            if track_id in cached_tracks:
-                track = cached_tracks[track_id]
-                results.append({
-                    'id': track['id'],
-                    'name': track['name'],
-                    'artists': [{'name': name} for name in track['artists']],
-                    'album': {
-                        'name': track['album'],
-                        'images': [],
-                        'release_date': track.get('album_release_date'),
-                        'release_date_precision': track.get('album_release_date_precision'),
-                    },
-                    'duration_ms': track['duration_ms'],
-                    'uri': f"spotify:track:{track['id']}",
-                    'album_art': track.get('album_art_url')
-                })
-        
-        # Preserve original order
-        result_map = {r['id']: r for r in results}
-        ordered_results = [result_map[tid] for tid in track_ids if tid in result_map]
-        
+            cached = from_cache(track_id)
+            if cached is not None:
+                append_result(_format_cached_track(cached))
+            else:
+                track = from_api(track_id)
+                if track is not None:
+                    append_result(_format_api_track(track))
+
         logger.info(f"Returned {len(ordered_results)} tracks ({len(cached_tracks)} from cache, {len(missing_ids)} from API)")
-        return ordered_results
+        return ORJSONResponse(ordered_results)
         
     except SpotifyException as e:
         logger.error(f"Spotify API error fetching tracks: {e}")
@@ -1,9 +1,11 @@
 import logging
+from types import MappingProxyType
 
 from fastapi import APIRouter, Depends, HTTPException, Path
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing import Optional, Literal, List
 
+from app.responses import ORJSONResponse
 from app.utils.session_manager import SessionManager
 from app.routes.playlists import require_auth
 from app.db import schedules as schedule_store
@@ -13,8 +15,20 @@ router_user = APIRouter(prefix="/schedules", tags=["schedules"])
 
 logger = logging.getLogger(__name__)
 
+# Default cadence per schedule type; read-only so handlers can share it.
+_FREQ_MAP = MappingProxyType({"daily": 1440, "weekly": 10080, "monthly": 43200})
+
+# Keys a schedule row must carry before it is worth validating at all.
+_REQUIRED_SCHED_KEYS = ("id", "action_type", "frequency_minutes")
+
+# Param keys copied from update bodies into stored schedule params.
+_SORT_PARAM_KEYS = ("sort_by", "direction", "method", "schedule_type", "hour_of_day", "day_of_week", "day_of_month", "timezone_offset_minutes")
+_CACHE_PARAM_KEYS = ("schedule_type", "hour_of_day", "day_of_week", "day_of_month", "timezone_offset_minutes")
+
 
 class SortScheduleRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     action_type: Literal["sort"] = "sort"
     sort_by: Literal['title', 'artist', 'album', 'release_date', 'date_added', 'duration'] = 'date_added'
     direction: Literal['asc', 'desc'] = 'desc'
@@ -42,6 +56,8 @@ class ScheduleResponse(BaseModel):
 
 
 class ScheduleUpdateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     enabled: Optional[bool] = None
     frequency_minutes: Optional[int] = Field(None, ge=15, le=60 * 24 * 14)
     timezone_offset_minutes: Optional[int] = None
@@ -55,6 +71,8 @@ class ScheduleUpdateRequest(BaseModel):
 
 
 class CacheScheduleRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     action_type: Literal["cache_clear"] = "cache_clear"
     schedule_type: Literal['daily', 'weekly', 'monthly'] = 'daily'
     hour_of_day: int = Field(3, ge=0, le=23, description="Hour of day (0-23) for scheduled run")
@@ -82,19 +100,19 @@ async def create_schedule(
         "timezone_offset_minutes": body.timezone_offset_minutes,
     }
     # Set default frequency for reference (daily/weekly/monthly)
-    freq_map = {"daily": 1440, "weekly": 10080, "monthly": 43200}
-    freq_minutes = freq_map.get(body.schedule_type, body.frequency_minutes)
+    freq_minutes = _FREQ_MAP.get(body.schedule_type, body.frequency_minutes)
 
+    user_id = session_mgr.get_user_id()
     sched_id = schedule_store.create_schedule(
         playlist_id=playlist_id,
-        user_id=session_mgr.get_user_id(),
+        user_id=user_id,
         session_id=session_mgr.session_id,
         action_type=body.action_type,
         params=schedule_params,
         frequency_minutes=freq_minutes,
         first_run_at=body.first_run_at,
     )
-    sched = schedule_store.get_schedule(sched_id, session_mgr.get_user_id())
+    sched = schedule_store.get_schedule(sched_id, user_id)
     return _to_response(sched)
 
 
@@ -115,22 +133,18 @@ async def update_schedule(
     body: ScheduleUpdateRequest,
     session_mgr: SessionManager = Depends(require_auth),
 ):
-    sched = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
+    user_id = session_mgr.get_user_id()
+    sched = schedule_store.get_schedule(schedule_id, user_id)
     if not sched or sched.get("playlist_id") != playlist_id:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
     fields = {}
     if body.enabled is not None:
         fields["enabled"] = 1 if body.enabled else 0
-    params_update = {}
-    for key in ("sort_by", "direction", "method", "schedule_type", "hour_of_day", "day_of_week", "day_of_month", "timezone_offset_minutes"):
-        val = getattr(body, key, None)
-        if val is not None:
-            params_update[key] = val
+    provided = body.model_dump(exclude_unset=True, exclude_none=True)
+    params_update = {key: provided[key] for key in _SORT_PARAM_KEYS if key in provided}
     if params_update:
-        new_params = (sched.get("params") or {}).copy()
-        new_params.update(params_update)
-        fields["params"] = new_params
+        fields["params"] = {**(sched.get("params") or {}), **params_update}
     if body.frequency_minutes is not None:
         fields["frequency_minutes"] = body.frequency_minutes
     if params_update or body.frequency_minutes is not None:
@@ -138,13 +152,11 @@ async def update_schedule(
     if not fields:
         return _to_response(sched)
 
-    schedule_store.update_schedule(schedule_id, session_mgr.get_user_id(), **fields)
-    updated = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
-    if updated and updated.get("next_run_at") is None:
-        # recompute based on updated params
-        next_run = schedule_store._compute_next_run(updated)
-        schedule_store.update_schedule(schedule_id, session_mgr.get_user_id(), next_run_at=next_run)
-        updated = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
+    # The store recomputes next_run_at from the updated params in the same
+    # transaction and returns the updated row.
+    updated = schedule_store.update_schedule(schedule_id, user_id, **fields)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Schedule not found")
     return _to_response(updated)
 
 
@@ -154,37 +166,47 @@ async def delete_schedule(
     schedule_id: int,
     session_mgr: SessionManager = Depends(require_auth),
 ):
-    sched = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
+    user_id = session_mgr.get_user_id()
+    sched = schedule_store.get_schedule(schedule_id, user_id)
     if not sched or sched.get("playlist_id") != playlist_id:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    schedule_store.delete_schedule(schedule_id, session_mgr.get_user_id())
+    schedule_store.delete_schedule(schedule_id, user_id)
     return {"message": "Schedule deleted"}
 
 
+def _response_fields(s: dict) -> dict:
+    return {
+        "id": s["id"],
+        "playlist_id": s.get("playlist_id"),
+        "action_type": s["action_type"],
+        "params": s.get("params") or {},
+        "frequency_minutes": s["frequency_minutes"],
+        "next_run_at": s.get("next_run_at"),
+        "last_run_at": s.get("last_run_at"),
+        "enabled": bool(s.get("enabled", 1)),
+        "status": s.get("status"),
+        "last_error": s.get("last_error"),
+    }
+
+
 def _to_response(s: dict) -> ScheduleResponse:
-    return ScheduleResponse(
-        id=s["id"],
-        playlist_id=s.get("playlist_id"),
-        action_type=s["action_type"],
-        params=s.get("params") or {},
-        frequency_minutes=s["frequency_minutes"],
-        next_run_at=s.get("next_run_at"),
-        last_run_at=s.get("last_run_at"),
-        enabled=bool(s.get("enabled", 1)),
-        status=s.get("status"),
-        last_error=s.get("last_error"),
-    )
+    # model_construct skips validation; rows on this path were just written
+    # by our own store. The list endpoints go through _safe_to_response,
+    # which validates so malformed rows are still filtered out.
+    return ScheduleResponse.model_construct(**_response_fields(s))
 
 
 class ScheduleListResponse(BaseModel):
     schedules: List[ScheduleResponse]
 
 
-@router_user.get("", response_model=ScheduleListResponse)
+@router_user.get("", response_class=ORJSONResponse, responses={200: {"model": ScheduleListResponse}})
 async def list_user_schedules(session_mgr: SessionManager = Depends(require_auth)):
     schedules = schedule_store.list_for_user(session_mgr.get_user_id())
     valid_schedules = [_safe_to_response(s) for s in schedules]
-    return {"schedules": [s for s in valid_schedules if s is not None]}
+    # Rows were validated by _safe_to_response; serialize with orjson and
+    # skip the response_model re-validation + jsonable_encoder pass.
+    return ORJSONResponse({"schedules": [s.model_dump() for s in valid_schedules if s is not None]})
 
 CACHE_GLOBAL_PLAYLIST_ID = "__cache_global__"
 
@@ -201,19 +223,19 @@ async def create_cache_schedule(
         "day_of_month": body.day_of_month,
         "timezone_offset_minutes": body.timezone_offset_minutes,
     }
-    freq_map = {"daily": 1440, "weekly": 10080, "monthly": 43200}
-    freq_minutes = freq_map.get(body.schedule_type, body.frequency_minutes)
+    freq_minutes = _FREQ_MAP.get(body.schedule_type, body.frequency_minutes)
 
+    user_id = session_mgr.get_user_id()
     sched_id = schedule_store.create_schedule(
         playlist_id=CACHE_GLOBAL_PLAYLIST_ID,
-        user_id=session_mgr.get_user_id(),
+        user_id=user_id,
         session_id=session_mgr.session_id,
         action_type=body.action_type,
         params=schedule_params,
         frequency_minutes=freq_minutes,
         first_run_at=body.first_run_at,
     )
-    sched = schedule_store.get_schedule(sched_id, session_mgr.get_user_id())
+    sched = schedule_store.get_schedule(sched_id, user_id)
     return _to_response(sched)
 
 
@@ -223,22 +245,18 @@ async def update_cache_schedule(
     body: ScheduleUpdateRequest,
     session_mgr: SessionManager = Depends(require_auth),
 ):
-    sched = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
+    user_id = session_mgr.get_user_id()
+    sched = schedule_store.get_schedule(schedule_id, user_id)
     if not sched or sched.get("playlist_id") != CACHE_GLOBAL_PLAYLIST_ID:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
     fields = {}
     if body.enabled is not None:
         fields["enabled"] = 1 if body.enabled else 0
-    params_update = {}
-    for key in ("schedule_type", "hour_of_day", "day_of_week", "day_of_month", "timezone_offset_minutes"):
-        val = getattr(body, key, None)
-        if val is not None:
-            params_update[key] = val
+    provided = body.model_dump(exclude_unset=True, exclude_none=True)
+    params_update = {key: provided[key] for key in _CACHE_PARAM_KEYS if key in provided}
     if params_update:
-        new_params = (sched.get("params") or {}).copy()
-        new_params.update(params_update)
-        fields["params"] = new_params
+        fields["params"] = {**(sched.get("params") or {}), **params_update}
     if body.frequency_minutes is not None:
         fields["frequency_minutes"] = body.frequency_minutes
     if params_update or body.frequency_minutes is not None:
@@ -246,12 +264,9 @@ async def update_cache_schedule(
     if not fields:
         return _to_response(sched)
 
-    schedule_store.update_schedule(schedule_id, session_mgr.get_user_id(), **fields)
-    updated = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
-    if updated and updated.get("next_run_at") is None:
-        next_run = schedule_store._compute_next_run(updated)
-        schedule_store.update_schedule(schedule_id, session_mgr.get_user_id(), next_run_at=next_run)
-        updated = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
+    updated = schedule_store.update_schedule(schedule_id, user_id, **fields)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Schedule not found")
     return _to_response(updated)
 
 
@@ -260,16 +275,29 @@ async def delete_cache_schedule(
     schedule_id: int,
     session_mgr: SessionManager = Depends(require_auth),
 ):
-    sched = schedule_store.get_schedule(schedule_id, session_mgr.get_user_id())
+    user_id = session_mgr.get_user_id()
+    sched = schedule_store.get_schedule(schedule_id, user_id)
     if not sched or sched.get("playlist_id") != CACHE_GLOBAL_PLAYLIST_ID:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    schedule_store.delete_schedule(schedule_id, session_mgr.get_user_id())
+    schedule_store.delete_schedule(schedule_id, user_id)
     return {"message": "Schedule deleted"}
 
 
 def _safe_to_response(schedule: dict) -> ScheduleResponse | None:
+    # Cheap key-presence gate first; the try/except only has to cover rows
+    # with the right keys but bad values.
+    if not all(key in schedule for key in _REQUIRED_SCHED_KEYS):
+        logger.warning("Skipping schedule %s: missing required keys", schedule.get("id"))
+        return None
     try:
-        return _to_response(schedule)
-    except (ValidationError, KeyError, TypeError) as exc:
+        return ScheduleResponse(**_response_fields(schedule))
+    except (ValidationError, TypeError) as exc:
         logger.warning("Skipping invalid schedule %s: %s", schedule.get("id"), exc)
         return None
+
+
+# Build the per-model validators/serializers at import time so the first
+# request doesn't pay the lazy-compilation cost.
+for _model in (SortScheduleRequest, ScheduleResponse, ScheduleUpdateRequest, CacheScheduleRequest):
+    _model.__pydantic_validator__
+    _model.__pydantic_serializer__
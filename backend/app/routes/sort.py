@@ -2,16 +2,18 @@
 API routes for playlist sorting operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
-from typing import Optional, Literal
+import asyncio
 import logging
+from typing import Optional, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
 
 from app.services.job_service import SortJobService
 from app.services.task_executor import start_sort_job, cancel_sort_job
 from app.services.spotify_service import SpotifyService
 from app.services.sort_service import (
-    calculate_moves_needed,
     estimate_sort_time,
     get_sort_key_function
 )
@@ -22,10 +24,52 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/playlists/{playlist_id}/sort", tags=["sorting"])
 
+_PAGE_LIMIT = 100
+# Cap on in-flight playlist_items calls so big playlists don't trip
+# Spotify's rate limiter.
+_PAGE_CONCURRENCY = 5
+_ANALYZE_FIELDS = 'items(track(id,name,uri,artists(name),album(name),duration_ms),added_at),total'
+
+
+async def _fetch_analysis_tracks(sp, playlist_id: str) -> list:
+    """Fetch all playlist items for analysis, paginating concurrently.
+
+    The first page establishes ``total``; remaining pages are fetched in
+    parallel threadpool calls instead of one blocking round trip per page.
+    """
+    first = await run_in_threadpool(
+        sp.playlist_items, playlist_id, limit=_PAGE_LIMIT, offset=0, fields=_ANALYZE_FIELDS
+    )
+    pages = [first]
+    total = first.get('total') or 0
+    if total > _PAGE_LIMIT:
+        semaphore = asyncio.Semaphore(_PAGE_CONCURRENCY)
+
+        async def fetch_page(offset: int):
+            async with semaphore:
+                return await run_in_threadpool(
+                    sp.playlist_items, playlist_id, limit=_PAGE_LIMIT, offset=offset, fields=_ANALYZE_FIELDS
+                )
+
+        pages.extend(await asyncio.gather(
+            *(fetch_page(offset) for offset in range(_PAGE_LIMIT, total, _PAGE_LIMIT))
+        ))
+
+    tracks = []
+    for page in pages:
+        for item in page['items']:
+            if item and item.get('track'):
+                track = item['track']
+                track['added_at'] = item.get('added_at')
+                tracks.append(track)
+    return tracks
+
 
 # Request/Response models
 class SortRequest(BaseModel):
     """Request to start a playlist sort."""
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     sort_by: Literal['title', 'artist', 'album', 'release_date', 'date_added', 'duration'] = 'date_added'
     direction: Literal['asc', 'desc'] = 'desc'
     method: Literal['fast', 'preserve'] = 'preserve'
@@ -66,6 +110,13 @@ class SortStatusResponse(BaseModel):
     estimated_time: Optional[int]
 
 
+# Build the per-model validators/serializers at import time so the first
+# request doesn't pay the lazy-compilation cost.
+for _model in (SortRequest, SortAnalysisResponse, SortJobResponse, SortStatusResponse):
+    _model.__pydantic_validator__
+    _model.__pydantic_serializer__
+
+
 def get_session_manager(request: Request) -> SessionManager:
     """Extract session manager from cookie."""
     session_id = request.cookies.get(SESSION_COOKIE_NAME)
@@ -96,34 +147,17 @@ async def analyze_sort(
         if not sp:
             raise HTTPException(status_code=401, detail="Spotify authentication expired")
         
-        # Fetch playlist tracks
-        tracks = []
-        offset = 0
-        limit = 100
-        
-        while True:
-            result = sp.playlist_items(
-                playlist_id,
-                limit=limit,
-                offset=offset,
-                fields='items(track(id,name,uri,artists(name),album(name),duration_ms),added_at),total'
-            )
-            
-            for item in result['items']:
-                if item and item.get('track'):
-                    track = item['track']
-                    track['added_at'] = item.get('added_at')
-                    tracks.append(track)
-            
-            if len(result['items']) < limit:
-                break
-            
-            offset += limit
-        
-        # Calculate moves needed
+        # Fetch playlist tracks (pages beyond the first fetched concurrently)
+        tracks = await _fetch_analysis_tracks(sp, playlist_id)
+
+        # Calculate moves needed: argsort an index list over precomputed keys
+        # and count positions whose track id changes, instead of materializing
+        # a sorted copy of the track dicts just to diff it.
         key_func, reverse = get_sort_key_function(request.sort_by, request.direction)
-        sorted_tracks = sorted(tracks, key=key_func, reverse=reverse)
-        tracks_to_move = calculate_moves_needed(tracks, sorted_tracks)
+        keys = [key_func(track) for track in tracks]
+        ids = [track['id'] for track in tracks]
+        order = sorted(range(len(tracks)), key=keys.__getitem__, reverse=reverse)
+        tracks_to_move = sum(1 for position, i in enumerate(order) if ids[i] != ids[position])
         
         # Estimate time
         estimated_time = estimate_sort_time(len(tracks), tracks_to_move, request.method)
@@ -8,27 +8,207 @@ This service implements a cache-aside pattern with opportunistic warming:
 - Track usage per user for user-specific cache management
 """
 
+import atexit
 import json
 import logging
+import queue
+import threading
 from datetime import datetime, timedelta, timezone
+from time import monotonic, sleep
 from typing import List, Dict, Optional, Set, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
 
-from app.db.database import get_db_connection
+import orjson
+
+from app.db.database import get_db_connection, get_read_connection
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Prepared once at import; executemany re-binds parameters against the same
+# statement instead of parsing SQL per row.
+_TRACK_UPSERT_SQL = """
+    INSERT INTO track_cache (
+        track_id,
+        name,
+        artists_json,
+        album,
+        album_release_date,
+        album_release_date_precision,
+        duration_ms,
+        album_art_url,
+        cached_at,
+        last_accessed
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(track_id) DO UPDATE SET
+        name = excluded.name,
+        artists_json = excluded.artists_json,
+        album = excluded.album,
+        album_release_date = excluded.album_release_date,
+        album_release_date_precision = excluded.album_release_date_precision,
+        duration_ms = excluded.duration_ms,
+        album_art_url = excluded.album_art_url,
+        cached_at = excluded.cached_at,
+        last_accessed = excluded.last_accessed
+"""
+
+_USAGE_UPSERT_SQL = """
+    INSERT INTO track_usage (track_id, session_id, last_used_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(track_id, session_id) DO UPDATE SET last_used_at = ?
+"""
+
+# Constant statement texts (ids bound via json_each) so SQLite's statement
+# cache hits on every call regardless of batch size.
+_SQL_GET_TRACKS = """
+    SELECT track_id, name, artists_json, album, album_release_date, album_release_date_precision, duration_ms, album_art_url
+    FROM track_cache
+    WHERE track_id IN (SELECT value FROM json_each(?))
+    AND cached_at > ?
+"""
+
+_SQL_TOUCH_ACCESSED = """
+    UPDATE track_cache
+    SET last_accessed = ?
+    WHERE track_id IN (SELECT value FROM json_each(?))
+"""
+
+_SQL_CACHE_COUNTS = """
+    SELECT
+        COALESCE(SUM(cached_at > ?), 0) as fresh,
+        COALESCE(SUM(cached_at <= ?), 0) as expired,
+        COUNT(*) as total
+    FROM track_cache
+"""
+
+_SQL_PLAYLIST_TRACK_IDS = """
+    SELECT DISTINCT track_id
+    FROM playlist_cache_items
+    WHERE playlist_id = ?
+    AND track_id IS NOT NULL
+"""
+
+_SQL_COUNT_CACHED_TRACKS = """
+    SELECT COUNT(DISTINCT track_id) as count
+    FROM track_cache
+    WHERE track_id IN (SELECT value FROM json_each(?))
+"""
+
+
+# TTL cutoff memo: the TTL is measured in days, so recomputing at most once
+# per second is indistinguishable from recomputing per call. Keying on the
+# monotonic-second bucket also keeps correlated queries within a request on
+# the same cutoff, so their counts add up.
+@lru_cache(maxsize=4)
+def _cutoff_for_bucket(bucket: int, ttl_days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=ttl_days)).isoformat()
+
+# Process-local memo in front of the SQLite cache. Repeated playlist views
+# re-request the same track ids within seconds; serving those from a dict
+# keeps the read path off the DB lock entirely. Entries expire after
+# _L1_TTL_SECONDS, and set_tracks invalidates ids it rewrites.
+_L1_TTL_SECONDS = 60.0
+_L1_MAX_ENTRIES = 50_000
+_l1_lock = threading.Lock()
+_l1_cache: Dict[str, Tuple[float, Dict]] = {}
+
+# Usage rows are statistical metadata (last_used_at), so they are written
+# behind the request path: reads enqueue (track_id, session_id, ts) tuples
+# and a daemon thread drains them about once a second with one batched
+# upsert, keeping the reader off the SQLite writer lock.
+_USAGE_FLUSH_INTERVAL = 1.0
+_USAGE_DRAIN_MAX = 1000
+_usage_queue: "queue.Queue[Tuple[str, str, str]]" = queue.Queue()
+
+
+def _flush_usage_rows(rows: List[Tuple[str, str, str]]) -> None:
+    if not rows:
+        return
+    # Dedupe by (track_id, session_id), keeping the newest timestamp.
+    latest: Dict[Tuple[str, str], str] = {}
+    for track_id, session_id, ts in rows:
+        key = (track_id, session_id)
+        prev = latest.get(key)
+        if prev is None or ts > prev:
+            latest[key] = ts
+    params = [(tid, sid, ts, ts) for (tid, sid), ts in latest.items()]
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(_USAGE_UPSERT_SQL, params)
+            conn.commit()
+    except Exception as exc:
+        logger.warning("Failed to flush %s usage rows: %s", len(params), exc)
+
+
+def _usage_writer_loop() -> None:
+    while True:
+        rows = [_usage_queue.get()]
+        # Let a burst accumulate, then drain it in one transaction.
+        sleep(_USAGE_FLUSH_INTERVAL)
+        while len(rows) < _USAGE_DRAIN_MAX:
+            try:
+                rows.append(_usage_queue.get_nowait())
+            except queue.Empty:
+                break
+        _flush_usage_rows(rows)
+
+
+def _flush_usage_queue_now() -> None:
+    """Drain whatever is queued synchronously (shutdown hook)."""
+    rows: List[Tuple[str, str, str]] = []
+    while True:
+        try:
+            rows.append(_usage_queue.get_nowait())
+        except queue.Empty:
+            break
+    _flush_usage_rows(rows)
+
+
+_usage_writer = threading.Thread(target=_usage_writer_loop, name="usage-writer", daemon=True)
+_usage_writer.start()
+atexit.register(_flush_usage_queue_now)
+
+
+def _pick_art(images: List[Dict]) -> Optional[str]:
+    """Preferred album art URL: the 300px image, else the first one.
+
+    Plain loop instead of a generator expression; this runs once per track
+    on the bulk-warming write path.
+    """
+    for img in images:
+        if img.get("height") == 300:
+            return img["url"]
+    return images[0]["url"] if images else None
+
+
+def _sessions_for_user(cursor, session_id: str) -> List[str]:
+    """All session ids belonging to the same user as ``session_id``.
+
+    One nested-subquery round trip; falls back to the session itself when
+    it has no user row.
+    """
+    cursor.execute(
+        """
+        SELECT session_id FROM user_sessions
+        WHERE user_id = (SELECT user_id FROM user_sessions WHERE session_id = ?)
+        """,
+        (session_id,),
+    )
+    sessions = [row["session_id"] for row in cursor.fetchall()]
+    return sessions or [session_id]
+
 
 class CacheService:
     """Service for managing track metadata cache."""
-    
+
     @staticmethod
     def _get_ttl_cutoff() -> str:
         """Calculate the cutoff datetime for cache expiry based on TTL setting."""
-        ttl_days = settings.track_cache_ttl_days
-        cutoff = datetime.now(timezone.utc) - timedelta(days=ttl_days)
-        return cutoff.isoformat()
+        return _cutoff_for_bucket(int(monotonic()), settings.track_cache_ttl_days)
     
     @staticmethod
     def get_tracks(track_ids: List[str], session_id: Optional[str] = None) -> Tuple[Dict[str, Dict], Set[str]]:
@@ -48,22 +228,34 @@ class CacheService:
         
         cached = {}
         missing = set(track_ids)
+
+        # L1: serve recently seen ids straight from the in-process memo.
+        now_mono = monotonic()
+        with _l1_lock:
+            for track_id in track_ids:
+                entry = _l1_cache.get(track_id)
+                if entry is not None and now_mono - entry[0] < _L1_TTL_SECONDS:
+                    cached[track_id] = entry[1]
+                    missing.discard(track_id)
+
+        need_db = [track_id for track_id in track_ids if track_id in missing]
+        if not need_db:
+            logger.info(f"Cache hit: {len(cached)}/{len(track_ids)} tracks (all in-process)")
+            return cached, missing
+
         cutoff = CacheService._get_ttl_cutoff()
         now = datetime.now(timezone.utc).isoformat()
-        
+
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            placeholders = ','.join('?' * len(track_ids))
-            
-            # Fetch from cache, excluding expired entries
-            cursor.execute(f"""
-                SELECT track_id, name, artists_json, album, album_release_date, album_release_date_precision, duration_ms, album_art_url
-                FROM track_cache
-                WHERE track_id IN ({placeholders})
-                AND cached_at > ?
-            """, (*track_ids, cutoff))
+
+            # Fetch from cache, excluding expired entries. Binding the id
+            # list as one json_each() parameter keeps the statement text
+            # constant for any batch size (and clears the 999-variable cap).
+            cursor.execute(_SQL_GET_TRACKS, (json.dumps(need_db), cutoff))
             
             rows = cursor.fetchall()
+            db_hits: Dict[str, Dict] = {}
             for row in rows:
                 track_id = row['track_id']
                 # Treat old rows (from before we stored release date fields) as a cache miss so the caller
@@ -74,10 +266,11 @@ class CacheService:
                 if not has_release_info:
                     continue
 
-                cached[track_id] = {
+                db_hits[track_id] = {
                     "id": track_id,
                     "name": row["name"],
-                    "artists": json.loads(row["artists_json"]),
+                    # orjson parses in C - this runs once per hit row.
+                    "artists": orjson.loads(row["artists_json"]),
                     "album": row["album"],
                     "album_release_date": album_release_date,
                     "album_release_date_precision": album_release_date_precision,
@@ -85,27 +278,29 @@ class CacheService:
                     "album_art_url": row["album_art_url"],
                 }
                 missing.discard(track_id)
-            
-            # Update last_accessed for cache hits
-            if cached:
-                cache_hit_ids = list(cached.keys())
-                placeholders_hits = ','.join('?' * len(cache_hit_ids))
-                cursor.execute(f"""
-                    UPDATE track_cache
-                    SET last_accessed = ?
-                    WHERE track_id IN ({placeholders_hits})
-                """, (now, *cache_hit_ids))
-                
-                # Track usage if session_id provided
+
+            cached.update(db_hits)
+
+            # Update last_accessed for DB cache hits; the usage upserts go
+            # through one executemany batch instead of a statement per hit.
+            # Memo-served ids refresh these columns when their entry expires.
+            if db_hits:
+                cache_hit_ids = list(db_hits.keys())
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(_SQL_TOUCH_ACCESSED, (now, json.dumps(cache_hit_ids)))
+
+                conn.commit()
+
                 if session_id:
                     for track_id in cache_hit_ids:
-                        cursor.execute("""
-                            INSERT INTO track_usage (track_id, session_id, last_used_at)
-                            VALUES (?, ?, ?)
-                            ON CONFLICT(track_id, session_id) DO UPDATE SET last_used_at = ?
-                        """, (track_id, session_id, now, now))
-                
-                conn.commit()
+                        _usage_queue.put((track_id, session_id, now))
+
+        if db_hits:
+            with _l1_lock:
+                if len(_l1_cache) + len(db_hits) > _L1_MAX_ENTRIES:
+                    _l1_cache.clear()
+                for track_id, track in db_hits.items():
+                    _l1_cache[track_id] = (now_mono, track)
         
         if cached:
             logger.info(f"Cache hit: {len(cached)}/{len(track_ids)} tracks, {len(missing)} misses")
@@ -129,88 +324,72 @@ class CacheService:
         if not tracks:
             return 0
         
-        now = datetime.now(tz=datetime.utcnow().astimezone().tzinfo).isoformat()
-        cached_count = 0
-        
+        now = datetime.now(timezone.utc).isoformat()
+
+        # Build both parameter batches in one pass; bad rows are skipped in
+        # Python so a single malformed track can't poison the batch.
+        cache_rows = []
+        usage_rows = []
+        for track in tracks:
+            try:
+                track_id = track['id']
+                artists = track.get('artists') or []
+                artists_json = orjson.dumps([artist.get('name') for artist in artists if artist]).decode()
+
+                album_data = track.get('album') or {}
+                album = album_data.get('name')
+                album_release_date = album_data.get('release_date')
+                album_release_date_precision = album_data.get('release_date_precision')
+                duration_ms = track.get('duration_ms')
+
+                # Get album art (prefer medium size, 300x300)
+                album_art_url = _pick_art(album_data.get('images') or [])
+
+                cache_rows.append((
+                    track_id,
+                    track['name'],
+                    artists_json,
+                    album,
+                    album_release_date,
+                    album_release_date_precision,
+                    duration_ms,
+                    album_art_url,
+                    now,
+                    now,
+                ))
+                if session_id:
+                    usage_rows.append((track_id, session_id, now))
+            except Exception as e:
+                logger.error(f"Failed to cache track {track.get('id')}: {e}")
+                continue
+
+        if not cache_rows:
+            return 0
+
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            
-            for track in tracks:
-                try:
-                    track_id = track['id']
-                    artists = track.get('artists') or []
-                    artists_json = json.dumps([artist.get('name') for artist in artists if artist])
-                    
-                    album_data = track.get('album') or {}
-                    album = album_data.get('name')
-                    album_release_date = album_data.get('release_date')
-                    album_release_date_precision = album_data.get('release_date_precision')
-                    duration_ms = track.get('duration_ms')
-                    
-                    # Get album art (prefer medium size)
-                    album_art_url = None
-                    album_images = album_data.get('images') or []
-                    if album_images:
-                        # Try to get medium-sized image (300x300)
-                        album_art_url = next(
-                            (img['url'] for img in album_images if img.get('height') == 300),
-                            album_images[0]['url']  # Fallback to first image
-                        )
-                    
-                    # Insert or update cache
-                    cursor.execute("""
-                        INSERT INTO track_cache (
-                            track_id,
-                            name,
-                            artists_json,
-                            album,
-                            album_release_date,
-                            album_release_date_precision,
-                            duration_ms,
-                            album_art_url,
-                            cached_at,
-                            last_accessed
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(track_id) DO UPDATE SET
-                            name = excluded.name,
-                            artists_json = excluded.artists_json,
-                            album = excluded.album,
-                            album_release_date = excluded.album_release_date,
-                            album_release_date_precision = excluded.album_release_date_precision,
-                            duration_ms = excluded.duration_ms,
-                            album_art_url = excluded.album_art_url,
-                            cached_at = excluded.cached_at,
-                            last_accessed = excluded.last_accessed
-                    """, (
-                        track_id,
-                        track['name'],
-                        artists_json,
-                        album,
-                        album_release_date,
-                        album_release_date_precision,
-                        duration_ms,
-                        album_art_url,
-                        now,
-                        now,
-                    ))
-                    
-                    # Track usage if session_id provided
-                    if session_id:
-                        cursor.execute("""
-                            INSERT INTO track_usage (track_id, session_id, last_used_at)
-                            VALUES (?, ?, ?)
-                            ON CONFLICT(track_id, session_id) DO UPDATE SET last_used_at = ?
-                        """, (track_id, session_id, now, now))
-                    
-                    cached_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Failed to cache track {track.get('id')}: {e}")
-                    continue
-            
-            conn.commit()
-        
+            try:
+                # One transaction for the whole batch - one journal write
+                # instead of per-row commits.
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(_TRACK_UPSERT_SQL, cache_rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        # Usage rows ride the write-behind queue; only the track upserts
+        # need to be durable before returning.
+        for usage_row in usage_rows:
+            _usage_queue.put(usage_row)
+
+        # Drop rewritten ids from the in-process memo so readers never see
+        # a pre-update row.
+        with _l1_lock:
+            for row in cache_rows:
+                _l1_cache.pop(row[0], None)
+
+        cached_count = len(cache_rows)
         logger.info(f"Cached {cached_count} tracks")
         return cached_count
     
@@ -243,40 +422,19 @@ class CacheService:
             Dict with cache statistics
         """
         cutoff = CacheService._get_ttl_cutoff()
-        
-        with get_db_connection() as conn:
+
+        with get_read_connection() as conn:
             cursor = conn.cursor()
 
             # Collect all session_ids for this user (all current sessions) so "your tracks" is stable across re-logins
-            session_ids_for_user = []
-            if session_id:
-                cursor.execute("SELECT user_id FROM user_sessions WHERE session_id = ?", (session_id,))
-                row = cursor.fetchone()
-                if row and row["user_id"]:
-                    cursor.execute("SELECT session_id FROM user_sessions WHERE user_id = ?", (row["user_id"],))
-                    session_ids_for_user = [r["session_id"] for r in cursor.fetchall()]
-                else:
-                    session_ids_for_user = [session_id]
-            
-            # Total cached tracks (not expired)
-            cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM track_cache
-                WHERE cached_at > ?
-            """, (cutoff,))
-            total_cached = cursor.fetchone()['count']
-            
-            # Expired tracks
-            cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM track_cache
-                WHERE cached_at <= ?
-            """, (cutoff,))
-            expired_count = cursor.fetchone()['count']
+            session_ids_for_user = _sessions_for_user(cursor, session_id) if session_id else []
             
-            # Total tracks in cache (including expired)
-            cursor.execute("SELECT COUNT(*) as count FROM track_cache")
-            total_in_db = cursor.fetchone()['count']
+            # Fresh/expired/total in one scan of track_cache instead of three
+            cursor.execute(_SQL_CACHE_COUNTS, (cutoff, cutoff))
+            counts = cursor.fetchone()
+            total_cached = counts['fresh']
+            expired_count = counts['expired']
+            total_in_db = counts['total']
             
             # User-specific stats
             user_track_count = None
@@ -311,28 +469,15 @@ class CacheService:
             Dict with playlist-specific cache statistics
         """
         cutoff = CacheService._get_ttl_cutoff()
-        
-        with get_db_connection() as conn:
+
+        with get_read_connection() as conn:
             cursor = conn.cursor()
 
             # Collect all session_ids for this user
-            session_ids_for_user = []
-            if session_id:
-                cursor.execute("SELECT user_id FROM user_sessions WHERE session_id = ?", (session_id,))
-                row = cursor.fetchone()
-                if row and row["user_id"]:
-                    cursor.execute("SELECT session_id FROM user_sessions WHERE user_id = ?", (row["user_id"],))
-                    session_ids_for_user = [r["session_id"] for r in cursor.fetchall()]
-                else:
-                    session_ids_for_user = [session_id]
+            session_ids_for_user = _sessions_for_user(cursor, session_id) if session_id else []
             
             # Get track IDs for this playlist from playlist_cache_items
-            cursor.execute("""
-                SELECT DISTINCT track_id
-                FROM playlist_cache_items
-                WHERE playlist_id = ?
-                AND track_id IS NOT NULL
-            """, (playlist_id,))
+            cursor.execute(_SQL_PLAYLIST_TRACK_IDS, (playlist_id,))
             track_ids = [r['track_id'] for r in cursor.fetchall()]
             
             if not track_ids:
@@ -342,14 +487,10 @@ class CacheService:
                     'total_cached_tracks': 0
                 }
             
-            track_placeholders = ",".join(["?"] * len(track_ids))
-            
+            track_ids_json = json.dumps(track_ids)
+
             # Total cached tracks from this playlist (all users) - count from track_cache
-            cursor.execute(f"""
-                SELECT COUNT(DISTINCT track_id) as count
-                FROM track_cache
-                WHERE track_id IN ({track_placeholders})
-            """, tuple(track_ids))
+            cursor.execute(_SQL_COUNT_CACHED_TRACKS, (track_ids_json,))
             total_cached = cursor.fetchone()['count']
             
             # User-specific stats for this playlist
@@ -358,27 +499,19 @@ class CacheService:
             if session_ids_for_user:
                 session_placeholders = ",".join(["?"] * len(session_ids_for_user))
                 
-                # Cached tracks from this playlist for this user (not expired)
-                cursor.execute(f"""
-                    SELECT COUNT(DISTINCT tc.track_id) as count
-                    FROM track_cache tc
-                    INNER JOIN track_usage tu ON tc.track_id = tu.track_id
-                    WHERE tc.track_id IN ({track_placeholders})
-                    AND tu.session_id IN ({session_placeholders})
-                    AND tc.cached_at > ?
-                """, tuple(track_ids) + tuple(session_ids_for_user) + (cutoff,))
-                user_track_count = cursor.fetchone()['count']
-                
-                # Expired tracks from this playlist for this user
+                # Fresh and expired per-user counts from one pass over the join
                 cursor.execute(f"""
-                    SELECT COUNT(DISTINCT tc.track_id) as count
+                    SELECT
+                        COUNT(DISTINCT CASE WHEN tc.cached_at > ? THEN tc.track_id END) as fresh,
+                        COUNT(DISTINCT CASE WHEN tc.cached_at <= ? THEN tc.track_id END) as expired
                     FROM track_cache tc
                     INNER JOIN track_usage tu ON tc.track_id = tu.track_id
-                    WHERE tc.track_id IN ({track_placeholders})
+                    WHERE tc.track_id IN (SELECT value FROM json_each(?))
                     AND tu.session_id IN ({session_placeholders})
-                    AND tc.cached_at <= ?
-                """, tuple(track_ids) + tuple(session_ids_for_user) + (cutoff,))
-                user_expired_count = cursor.fetchone()['count']
+                """, (cutoff, cutoff, track_ids_json) + tuple(session_ids_for_user))
+                user_counts = cursor.fetchone()
+                user_track_count = user_counts['fresh']
+                user_expired_count = user_counts['expired']
             
             return {
                 'user_cached_tracks': user_track_count,
@@ -389,27 +522,47 @@ class CacheService:
     @staticmethod
     def clear_expired() -> int:
         """
-        Remove expired tracks from cache.
-        
+        Remove expired tracks from cache, then evict least-recently-accessed
+        tracks beyond the configured size cap.
+
         Returns:
             Number of tracks removed
         """
         cutoff = CacheService._get_ttl_cutoff()
-        
+        max_entries = settings.track_cache_max_entries
+
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            
+
             # Delete expired tracks
             cursor.execute("""
                 DELETE FROM track_cache
                 WHERE cached_at <= ?
             """, (cutoff,))
-            
+
             deleted = cursor.rowcount
+
+            # LRU-style bound: drop the oldest-accessed rows past the cap.
+            # idx_track_cache_accessed makes the ORDER BY an index walk.
+            cursor.execute("""
+                DELETE FROM track_cache
+                WHERE rowid IN (
+                    SELECT rowid FROM track_cache
+                    ORDER BY last_accessed ASC
+                    LIMIT max(0, (SELECT COUNT(*) FROM track_cache) - ?)
+                )
+            """, (max_entries,))
+
+            evicted = cursor.rowcount
             conn.commit()
-        
+
+        with _l1_lock:
+            _l1_cache.clear()
+
         logger.info(f"Cleared {deleted} expired tracks from cache")
-        return deleted
+        if evicted:
+            logger.info(f"Evicted {evicted} least-recently-accessed tracks (cap {max_entries})")
+        return deleted + evicted
     
     @staticmethod
     def clear_user_cache(session_id: str) -> int:
@@ -433,15 +586,23 @@ class CacheService:
             
             deleted = cursor.rowcount
             
-            # Clean up orphaned tracks (not used by any user)
+            # Clean up orphaned tracks (not used by any user). NOT EXISTS
+            # probes the track_usage primary key per row instead of
+            # materializing a DISTINCT list for NOT IN.
             cursor.execute("""
                 DELETE FROM track_cache
-                WHERE track_id NOT IN (SELECT DISTINCT track_id FROM track_usage)
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM track_usage tu
+                    WHERE tu.track_id = track_cache.track_id
+                )
             """)
             
             orphaned = cursor.rowcount
             conn.commit()
-        
+
+        with _l1_lock:
+            _l1_cache.clear()
+
         logger.info(f"Cleared {deleted} track usage entries for user, removed {orphaned} orphaned tracks")
         return deleted
     
@@ -455,16 +616,24 @@ class CacheService:
         """
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            
-            # Clear track usage first (foreign key constraint)
-            cursor.execute("DELETE FROM track_usage")
-            usage_deleted = cursor.rowcount
-            
-            # Clear track cache
-            cursor.execute("DELETE FROM track_cache")
-            cache_deleted = cursor.rowcount
-            
-            conn.commit()
-        
+
+            # Counts first (executescript doesn't report rowcount), then both
+            # truncate-optimized deletes in one script/transaction. Usage goes
+            # first (foreign key constraint).
+            cursor.execute("SELECT COUNT(*) FROM track_usage")
+            usage_deleted = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM track_cache")
+            cache_deleted = cursor.fetchone()[0]
+
+            conn.executescript("""
+                BEGIN IMMEDIATE;
+                DELETE FROM track_usage;
+                DELETE FROM track_cache;
+                COMMIT;
+            """)
+
+        with _l1_lock:
+            _l1_cache.clear()
+
         logger.info(f"Cleared entire cache: {cache_deleted} tracks, {usage_deleted} usage entries")
         return cache_deleted
@@ -6,7 +6,7 @@ Fetches playlist details to warm the local cache without blocking API requests.
 
 import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Iterable, List, Optional
 from uuid import uuid4
@@ -21,6 +21,14 @@ _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-worker")
 _jobs_lock = threading.Lock()
 _jobs_by_user: Dict[str, Dict] = {}
 
+# Playlists whose items are written under one transaction; each flush costs
+# one commit instead of several per playlist.
+_WARM_FLUSH_SIZE = 8
+
+# Concurrent Spotify fetches within one warm job; keeps per-user request
+# rate modest while overlapping network round trips.
+_WARM_FETCH_CONCURRENCY = 4
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -77,37 +85,79 @@ def _update_job(user_id: str, **updates: Dict) -> None:
         job["updated_at"] = _now_iso()
 
 
+def _increment_job(user_id: str) -> None:
+    """Bump the completed counter atomically under one lock acquisition."""
+    with _jobs_lock:
+        job = _jobs_by_user.get(user_id)
+        if not job:
+            return
+        job["completed"] += 1
+        job["updated_at"] = _now_iso()
+
+
+def _flush_warm_batch(pending: List[Dict], user_id: str) -> None:
+    if not pending:
+        return
+    try:
+        failed = playlist_cache_store.refresh_many(pending)
+    except Exception as exc:
+        failed = [entry["playlist_id"] for entry in pending]
+        logger.warning("Failed to write cache-warm batch (user=%s): %s", user_id, exc)
+    for playlist_id in failed:
+        playlist_cache_store.mark_dirty(playlist_id)
+    logger.info(
+        "Warmed cache for %s playlists (user=%s)", len(pending) - len(failed), user_id
+    )
+    pending.clear()
+
+
+def _fetch_warm_entry(spotify_service: SpotifyService, playlist_id: str) -> Dict:
+    playlist = spotify_service.get_playlist_details(playlist_id, should_warm_cache=True)
+    snapshot_id = getattr(playlist, "snapshot_id", None)
+    items = []
+    for idx, track in enumerate(playlist.tracks or []):
+        if not track or not getattr(track, "id", None):
+            continue
+        added_at = track.added_at.isoformat() if getattr(track, "added_at", None) else None
+        items.append(
+            {
+                "position": idx,
+                "track_id": track.id,
+                "added_at": added_at,
+            }
+        )
+    return {
+        "playlist_id": playlist_id,
+        "items": items,
+        "snapshot_id": snapshot_id,
+    }
+
+
 def _run_cache_warm(user_id: str, session_id: str, playlist_ids: List[str], job_id: str) -> None:
     spotify_service = SpotifyService(session_manager=SessionManager(session_id=session_id))
 
-    for playlist_id in playlist_ids:
-        try:
-            playlist = spotify_service.get_playlist_details(playlist_id, should_warm_cache=True)
-            snapshot_id = getattr(playlist, "snapshot_id", None)
-            items = []
-            for idx, track in enumerate(playlist.tracks or []):
-                if not track or not getattr(track, "id", None):
-                    continue
-                added_at = track.added_at.isoformat() if getattr(track, "added_at", None) else None
-                items.append(
-                    {
-                        "position": idx,
-                        "track_id": track.id,
-                        "added_at": added_at,
-                    }
-                )
-            playlist_cache_store.refresh_cached_playlist(
-                playlist_id=playlist_id,
-                items=items,
-                snapshot_id=snapshot_id,
-            )
-            logger.info("Warmed cache for playlist %s (user=%s)", playlist_id, user_id)
-        except Exception as exc:
-            playlist_cache_store.mark_dirty(playlist_id)
-            logger.warning("Failed to warm cache for playlist %s (user=%s): %s", playlist_id, user_id, exc)
-        finally:
-            with _jobs_lock:
-                current_completed = _jobs_by_user.get(user_id, {}).get("completed", 0)
-            _update_job(user_id, completed=current_completed + 1)
-
+    pending: List[Dict] = []
+    # Fetches overlap on a small per-job pool so Spotify round trips run
+    # concurrently; results drain through as_completed and are still
+    # written in batches of _WARM_FLUSH_SIZE.
+    with ThreadPoolExecutor(
+        max_workers=_WARM_FETCH_CONCURRENCY, thread_name_prefix="cache-fetch"
+    ) as fetch_pool:
+        futures = {
+            fetch_pool.submit(_fetch_warm_entry, spotify_service, playlist_id): playlist_id
+            for playlist_id in playlist_ids
+        }
+        for future in as_completed(futures):
+            playlist_id = futures[future]
+            try:
+                pending.append(future.result())
+                if len(pending) >= _WARM_FLUSH_SIZE:
+                    _flush_warm_batch(pending, user_id)
+            except Exception as exc:
+                playlist_cache_store.mark_dirty(playlist_id)
+                logger.warning("Failed to warm cache for playlist %s (user=%s): %s", playlist_id, user_id, exc)
+            finally:
+                _increment_job(user_id)
+
+    _flush_warm_batch(pending, user_id)
     _update_job(user_id, status="completed")
@@ -7,10 +7,18 @@ from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 import logging
 
-from app.db.database import get_db_connection
+from app.db.database import get_db_connection, get_read_connection
 
 logger = logging.getLogger(__name__)
 
+# Explicit column list (constant statement text also keeps sqlite3's
+# per-connection statement cache warm now that connections are pooled).
+_JOB_COLS = (
+    "job_id, playlist_id, user_id, sort_by, direction, method, status, "
+    "progress, total, started_at, updated_at, completed_at, message, error, "
+    "tracks_to_move, estimated_time"
+)
+
 
 class SortJobService:
     """Service for managing playlist sort jobs."""
@@ -24,17 +32,23 @@ class SortJobService:
         method: str,
         total_tracks: int,
         tracks_to_move: int,
-        estimated_time: int
+        estimated_time: int,
+        initial_status: str = 'pending',
+        initial_message: str = 'Sort job created'
     ) -> str:
         """
         Create a new sort job.
-        
+
+        Callers that start work in-band can pass initial_status /
+        initial_message so the row is written with its final state in one
+        INSERT instead of an INSERT followed by an immediate UPDATE.
+
         Returns:
             job_id: Unique identifier for the job
         """
         job_id = f"sort_{uuid.uuid4().hex[:12]}"
         now = datetime.now(timezone.utc).isoformat()
-        
+
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -45,20 +59,20 @@ class SortJobService:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 job_id, playlist_id, user_id, sort_by, direction, method,
-                'pending', 0, total_tracks, now, now,
-                tracks_to_move, estimated_time, 'Sort job created'
+                initial_status, 0, total_tracks, now, now,
+                tracks_to_move, estimated_time, initial_message
             ))
             conn.commit()
-        
+
         logger.info(f"Created sort job {job_id} for playlist {playlist_id}")
         return job_id
     
     @staticmethod
     def get_job(job_id: str) -> Optional[Dict[str, Any]]:
         """Get job details by job_id."""
-        with get_db_connection() as conn:
+        with get_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM sort_jobs WHERE job_id = ?", (job_id,))
+            cursor.execute(f"SELECT {_JOB_COLS} FROM sort_jobs WHERE job_id = ?", (job_id,))
             row = cursor.fetchone()
             
             if row:
@@ -77,54 +91,56 @@ class SortJobService:
         - > 1000 tracks: 15 minutes
         """
         from datetime import timedelta
-        
-        with get_db_connection() as conn:
+
+        with get_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM sort_jobs 
-                WHERE playlist_id = ? 
+            cursor.execute(f"""
+                SELECT {_JOB_COLS} FROM sort_jobs
+                WHERE playlist_id = ?
                 AND status IN ('pending', 'in_progress')
                 ORDER BY started_at DESC
                 LIMIT 1
             """, (playlist_id,))
             row = cursor.fetchone()
-            
-            if row:
-                job = dict(row)
-                
-                # Check if pending job is stale
-                if job['status'] == 'pending':
-                    started_at = datetime.fromisoformat(job['started_at'])
-                    now = datetime.now(timezone.utc)
-                    age = now - started_at
-                    
-                    # Calculate timeout based on playlist size
-                    total_tracks = job.get('total', 0)
-                    if total_tracks < 100:
-                        timeout_minutes = 2
-                    elif total_tracks < 500:
-                        timeout_minutes = 5
-                    elif total_tracks < 1000:
-                        timeout_minutes = 10
-                    else:
-                        timeout_minutes = 15
-                    
-                    if age > timedelta(minutes=timeout_minutes):
-                        # Mark as failed
-                        logger.warning(
-                            f"Job {job['job_id']} stuck in pending for {age.total_seconds():.0f}s "
-                            f"({total_tracks} tracks, timeout {timeout_minutes}m), marking as failed"
-                        )
-                        SortJobService.update_job(
-                            job['job_id'],
-                            status='failed',
-                            error='Job timed out - did not start within expected timeframe',
-                            message='Job failed to start'
-                        )
-                        return None  # Don't return stale job
-                
-                return job
+
+        if not row:
             return None
+
+        job = dict(row)
+
+        # Check if pending job is stale (outside the read block so the
+        # corrective update takes the writer on its own)
+        if job['status'] == 'pending':
+            started_at = datetime.fromisoformat(job['started_at'])
+            now = datetime.now(timezone.utc)
+            age = now - started_at
+
+            # Calculate timeout based on playlist size
+            total_tracks = job.get('total', 0)
+            if total_tracks < 100:
+                timeout_minutes = 2
+            elif total_tracks < 500:
+                timeout_minutes = 5
+            elif total_tracks < 1000:
+                timeout_minutes = 10
+            else:
+                timeout_minutes = 15
+
+            if age > timedelta(minutes=timeout_minutes):
+                # Mark as failed
+                logger.warning(
+                    f"Job {job['job_id']} stuck in pending for {age.total_seconds():.0f}s "
+                    f"({total_tracks} tracks, timeout {timeout_minutes}m), marking as failed"
+                )
+                SortJobService.update_job(
+                    job['job_id'],
+                    status='failed',
+                    error='Job timed out - did not start within expected timeframe',
+                    message='Job failed to start'
+                )
+                return None  # Don't return stale job
+
+        return job
     
     @staticmethod
     def update_job(
@@ -191,10 +207,10 @@ class SortJobService:
     @staticmethod
     def get_recent_jobs(user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent jobs for a user."""
-        with get_db_connection() as conn:
+        with get_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM sort_jobs 
+            cursor.execute(f"""
+                SELECT {_JOB_COLS} FROM sort_jobs
                 WHERE user_id = ?
                 ORDER BY started_at DESC
                 LIMIT ?
@@ -205,7 +221,7 @@ class SortJobService:
     @staticmethod
     def get_user_active_job_count(user_id: str) -> int:
         """Count how many jobs this user currently has running/queued."""
-        with get_db_connection() as conn:
+        with get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT COUNT(*) FROM sort_jobs 
@@ -218,7 +234,7 @@ class SortJobService:
     @staticmethod
     def get_pending_job_count() -> int:
         """Get total number of pending jobs across all users."""
-        with get_db_connection() as conn:
+        with get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT COUNT(*) FROM sort_jobs 
@@ -7,60 +7,123 @@ Implements two methods:
 """
 
 import logging
+from operator import itemgetter
 from typing import List, Dict, Any, Callable, Tuple
 from spotipy import Spotify
 
 logger = logging.getLogger(__name__)
 
 
+# Straight-line key extractors, one per sort criterion. These run once per
+# track (callers materialize the key before sorting), so they avoid the
+# generic nested-dict walker that did isinstance checks per level.
+
+def _title_key(t: Dict) -> str:
+    return (t.get('name') or '').lower()
+
+
+def _artist_key(t: Dict) -> str:
+    artists = t.get('artists')
+    if not artists:
+        return ''
+    first = artists[0]
+    if not isinstance(first, dict):
+        return ''
+    return (first.get('name') or '').lower()
+
+
+def _album_key(t: Dict) -> str:
+    album = t.get('album')
+    if not isinstance(album, dict):
+        return ''
+    return (album.get('name') or '').lower()
+
+
+def _release_date_key(t: Dict) -> str:
+    album = t.get('album')
+    if not isinstance(album, dict):
+        return '0000-00-00'
+    return album.get('release_date') or '0000-00-00'
+
+
+def _date_added_key(t: Dict) -> str:
+    return t.get('added_at') or '1970-01-01T00:00:00Z'
+
+
+def _duration_key(t: Dict) -> int:
+    return int(t.get('duration_ms') or 0)
+
+
+_SORT_KEY_FUNCS = {
+    'title': _title_key,
+    'artist': _artist_key,
+    'album': _album_key,
+    'release_date': _release_date_key,
+    'date_added': _date_added_key,
+    'duration': _duration_key,
+}
+
+
 def get_sort_key_function(sort_by: str, direction: str) -> Callable:
     """
     Get the sort key function for a given sort criterion.
-    
+
     Args:
         sort_by: Field to sort by (title, artist, album, release_date, date_added, duration)
         direction: 'asc' or 'desc'
-    
+
     Returns:
         Function that extracts the sort key from a track
     """
     reverse = (direction == 'desc')
-    
-    def safe_get(track: Dict, *keys: str, default: str = ''):
-        """Safely get nested dict values."""
-        value = track
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            elif isinstance(value, list) and len(value) > 0:
-                value = value[0] if key == '0' else value
-            else:
-                return default
-            
-            if value is None:
-                return default
-        
-        return value or default
-    
-    # Define sort key extractors
-    if sort_by == 'title':
-        key_func = lambda t: safe_get(t, 'name', default='').lower()
-    elif sort_by == 'artist':
-        key_func = lambda t: safe_get(t, 'artists', '0', 'name', default='').lower()
-    elif sort_by == 'album':
-        key_func = lambda t: safe_get(t, 'album', 'name', default='').lower()
-    elif sort_by == 'release_date':
-        key_func = lambda t: safe_get(t, 'album', 'release_date', default='0000-00-00')
-    elif sort_by == 'date_added':
-        key_func = lambda t: safe_get(t, 'added_at', default='1970-01-01T00:00:00Z')
-    elif sort_by == 'duration':
-        key_func = lambda t: int(safe_get(t, 'duration_ms', default='0'))
-    else:
+    key_func = _SORT_KEY_FUNCS.get(sort_by)
+    if key_func is None:
         raise ValueError(f"Unknown sort_by value: {sort_by}")
-    
     return key_func, reverse
 
 
+class _OrderedMultiset:
+    """Fenwick tree over original track indices for reorder bookkeeping.
+
+    The preserve-dates insertion sort extracts tracks one at a time into a
+    sorted prefix, which keeps the remaining tracks in their original
+    relative order. So the current playlist position of an unplaced track is
+    (number already placed) + (number of unplaced tracks originally before
+    it). This structure answers that second count and removes placed tracks
+    in O(log n), versus the O(n) element shifts of a plain list.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        # Linear-time build of a tree of all ones.
+        tree = [0] * (size + 1)
+        for i in range(1, size + 1):
+            tree[i] += 1
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def count_before(self, index: int) -> int:
+        """Number of unplaced entries with original index < ``index``."""
+        tree = self._tree
+        total = 0
+        i = index  # prefix over tree slots 1..index == original indices 0..index-1
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def remove(self, index: int) -> None:
+        """Mark the entry at original ``index`` as placed."""
+        tree = self._tree
+        size = self._size
+        i = index + 1
+        while i <= size:
+            tree[i] -= 1
+            i += i & -i
+
+
 def calculate_moves_needed(current_order: List[Dict], sorted_order: List[Dict]) -> int:
     """
     Calculate how many tracks need to be moved.
@@ -98,12 +161,14 @@ async def sort_playlist_fast(
     """
     logger.info(f"Fast sort: {len(tracks)} tracks by {sort_by} ({direction})")
     
-    # Sort tracks
+    # Sort tracks: materialize keys once, then argsort over indices so the
+    # extractor runs n times instead of once per comparison.
     key_func, reverse = get_sort_key_function(sort_by, direction)
-    sorted_tracks = sorted(tracks, key=key_func, reverse=reverse)
-    
+    keys = [key_func(track) for track in tracks]
+    order = sorted(range(len(tracks)), key=keys.__getitem__, reverse=reverse)
+
     # Extract URIs
-    track_uris = [track['uri'] for track in sorted_tracks]
+    track_uris = [tracks[i]['uri'] for i in order]
     
     # Replace playlist in batches of 100
     batch_size = 100
@@ -156,11 +221,11 @@ async def sort_playlist_preserve_dates(
     # Get sort key function
     key_func, reverse = get_sort_key_function(sort_by, direction)
     
-    # Create list of (index, track, sort_key) tuples
+    # Create list of (index, track, sort_key) tuples - keys extracted once
     indexed_tracks = [(i, track, key_func(track)) for i, track in enumerate(tracks)]
-    
+
     # Sort by key to get target order
-    sorted_indexed = sorted(indexed_tracks, key=lambda x: x[2], reverse=reverse)
+    sorted_indexed = sorted(indexed_tracks, key=itemgetter(2), reverse=reverse)
     
     # Calculate moves needed
     moves_needed = sum(1 for i, (orig_idx, _, _) in enumerate(sorted_indexed) if orig_idx != i)
@@ -172,49 +237,74 @@ async def sort_playlist_preserve_dates(
             progress_callback(len(tracks), "Playlist already sorted")
         return
     
-    # Use insertion sort algorithm - move one track at a time into correct position
-    current_positions = list(range(len(tracks)))  # Track where each original track currently is
+    # Use insertion sort algorithm - move contiguous runs of tracks into
+    # their correct positions. The reorder API accepts range_length, so a
+    # block of tracks that sits together and lands together costs one
+    # round trip instead of one per track.
+    unplaced = _OrderedMultiset(len(tracks))  # tracks not yet in the sorted prefix
+    total = len(sorted_indexed)
     moves_made = 0
-    
-    for target_pos in range(len(sorted_indexed)):
+    api_calls = 0
+
+    target_pos = 0
+    while target_pos < total:
         # Check for cancellation
         if should_cancel and should_cancel():
             logger.info("Sort cancelled by user")
             return
-        
+
         # Find which track should be at this position
         target_orig_idx, target_track, _ = sorted_indexed[target_pos]
-        
-        # Where is this track currently?
-        current_pos = current_positions.index(target_orig_idx)
-        
-        if current_pos != target_pos:
-            # Need to move track from current_pos to target_pos
-            sp.playlist_reorder_items(
-                playlist_id,
-                range_start=current_pos,
-                insert_before=target_pos if target_pos < current_pos else target_pos + 1,
-                range_length=1
+
+        # Where is this track currently? target_pos tracks are already
+        # placed ahead of it, plus any unplaced tracks originally before it.
+        base_count = unplaced.count_before(target_orig_idx)
+        current_pos = target_pos + base_count
+
+        if current_pos == target_pos:
+            # Already in place - drop it from the unplaced set and move on.
+            unplaced.remove(target_orig_idx)
+            target_pos += 1
+            continue
+
+        # Extend the run while the following targets sit contiguously after
+        # this track, so the whole block can move in one call.
+        run_length = 1
+        while target_pos + run_length < total:
+            next_orig_idx = sorted_indexed[target_pos + run_length][0]
+            if unplaced.count_before(next_orig_idx) != base_count + run_length:
+                break
+            run_length += 1
+
+        # Move the block from current_pos to target_pos (current_pos is
+        # always past target_pos, so insert_before is the target itself)
+        sp.playlist_reorder_items(
+            playlist_id,
+            range_start=current_pos,
+            insert_before=target_pos,
+            range_length=run_length
+        )
+
+        for offset in range(run_length):
+            unplaced.remove(sorted_indexed[target_pos + offset][0])
+
+        moves_made += run_length
+        api_calls += 1
+
+        if progress_callback:
+            progress_callback(
+                moves_made,
+                f"Moved track {moves_made}/{moves_needed}: {target_track['name'][:40]}"
             )
-            
-            # Update our tracking of positions
-            moved_track = current_positions.pop(current_pos)
-            current_positions.insert(target_pos, moved_track)
-            
-            moves_made += 1
-            
-            if progress_callback:
-                progress_callback(
-                    moves_made,
-                    f"Moved track {moves_made}/{moves_needed}: {target_track['name'][:40]}"
-                )
-            
-            # Small delay to avoid rate limiting
-            if moves_made % 10 == 0:
-                import time
-                time.sleep(0.1)
-    
-    logger.info(f"Preserve dates sort completed: {moves_made} tracks moved")
+
+        # Small delay to avoid rate limiting
+        if api_calls % 10 == 0:
+            import time
+            time.sleep(0.1)
+
+        target_pos += run_length
+
+    logger.info(f"Preserve dates sort completed: {moves_made} tracks moved in {api_calls} reorder calls")
 
 
 def estimate_sort_time(total_tracks: int, tracks_to_move: int, method: str) -> int:
@@ -13,10 +13,12 @@ Functions:
 
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth, SpotifyClientCredentials
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 import logging
 from fastapi import Request
 import httpx
+import orjson
+import requests
 
 from app.config import settings
 from app.models.schemas import (
@@ -38,6 +40,30 @@ from app.utils.session_manager import SessionManager, SESSION_COOKIE_NAME
 logger = logging.getLogger(__name__)
 
 
+def _make_orjson_session() -> requests.Session:
+    """
+    Build a requests session whose responses decode JSON with orjson.
+
+    spotipy parses every API response through ``response.json()``; swapping
+    the decoder for orjson speeds up parsing of the large playlist/track
+    payloads this service traffics in. Shared module-wide so all clients
+    also reuse the underlying connection pool.
+    """
+    session = requests.Session()
+    original_send = session.send
+
+    def send(request, **kwargs):
+        response = original_send(request, **kwargs)
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+    session.send = send
+    return session
+
+
+_SPOTIFY_SESSION = _make_orjson_session()
+
+
 class SpotifyService:
     """
     Spotify API Service
@@ -228,7 +254,7 @@ class SpotifyService:
         if not access_token:
             raise ValueError("No access token available. Please authenticate first.")
         
-        return spotipy.Spotify(auth=access_token)
+        return spotipy.Spotify(auth=access_token, requests_session=_SPOTIFY_SESSION)
     
     def get_spotify_client(self, user_id: str) -> Optional[spotipy.Spotify]:
         """
@@ -512,6 +538,142 @@ class SpotifyService:
         logger.info(f"Retrieved playlist '{playlist.name}' with {len(tracks)} tracks")
         return playlist
     
+    def open_playlist_detail_stream(self, playlist_id: str, should_warm_cache: bool = True) -> Iterator[bytes]:
+        """
+        Fetch playlist detail as an incrementally rendered JSON byte stream.
+
+        Fetches the playlist metadata up front (so not-found errors still
+        surface before any bytes are sent), then returns a generator that
+        emits the same JSON shape as ``get_playlist_details`` page by page.
+        This keeps time-to-first-byte and peak memory independent of the
+        playlist size instead of materializing thousands of track models
+        before serialization starts.
+
+        Args:
+            playlist_id: Spotify playlist ID
+            should_warm_cache: Whether to warm the track cache after streaming
+
+        Returns:
+            Iterator of JSON byte chunks forming one PlaylistDetail document
+
+        Raises:
+            ValueError: If not authenticated
+            SpotifyException: If the metadata fetch fails or playlist not found
+        """
+        client = self.get_client()
+        playlist_data = client.playlist(
+            playlist_id,
+            fields="id,name,description,images,owner,public,collaborative,followers,uri,snapshot_id"
+        )
+
+        def generate() -> Iterator[bytes]:
+            header = {
+                "id": playlist_data["id"],
+                "name": playlist_data["name"],
+                "description": playlist_data.get("description"),
+                "images": playlist_data.get("images", []),
+                "owner": {
+                    "id": playlist_data["owner"]["id"],
+                    "display_name": playlist_data["owner"].get("display_name")
+                },
+                "public": playlist_data.get("public"),
+                "collaborative": playlist_data.get("collaborative", False),
+            }
+            yield orjson.dumps(header)[:-1] + b',"tracks":['
+
+            tracks_data_for_cache = []
+            track_ids = []
+            total_tracks = 0
+            offset = 0
+            limit = 100
+            first = True
+
+            while True:
+                results = client.playlist_tracks(
+                    playlist_id,
+                    limit=limit,
+                    offset=offset,
+                    fields="items(added_at,track(id,name,artists(id,name,uri),album(id,name,images,release_date,release_date_precision,album_type,total_tracks,uri),duration_ms,uri,preview_url,explicit,popularity)),total,next"
+                )
+                if offset == 0:
+                    total_tracks = results.get("total", 0)
+
+                for item in results["items"]:
+                    try:
+                        track_data = item["track"]
+                        if not track_data or not track_data.get("id"):
+                            continue
+                        tracks_data_for_cache.append(track_data)
+                        track = PlaylistTrack(
+                            id=track_data["id"],
+                            name=track_data["name"],
+                            artists=[
+                                ArtistSimple(**artist)
+                                for artist in track_data["artists"]
+                            ],
+                            album=AlbumSimple(
+                                id=track_data["album"]["id"],
+                                name=track_data["album"]["name"],
+                                images=[ImageObject(**img) for img in track_data["album"].get("images", [])],
+                                release_date=track_data["album"].get("release_date"),
+                                release_date_precision=track_data["album"].get("release_date_precision"),
+                                album_type=track_data["album"].get("album_type"),
+                                total_tracks=track_data["album"].get("total_tracks"),
+                                uri=track_data["album"]["uri"]
+                            ),
+                            duration_ms=track_data["duration_ms"],
+                            added_at=item.get("added_at"),
+                            uri=track_data["uri"],
+                            preview_url=track_data.get("preview_url"),
+                            explicit=track_data.get("explicit", False),
+                            popularity=track_data.get("popularity")
+                        )
+                        track_ids.append(track.id)
+                        chunk = orjson.dumps(track.model_dump())
+                        yield chunk if first else b"," + chunk
+                        first = False
+                    except Exception as e:
+                        logger.warning(f"Failed to parse track: {e}")
+                        continue
+
+                if results["next"] is None:
+                    break
+                offset += limit
+
+            # Warm the cache after all tracks have been emitted
+            session_id = self.session_manager.session_id if self.session_manager else None
+            cache_hits = 0
+            cache_misses = len(track_ids)
+            cache_warmed = 0
+            if track_ids and should_warm_cache:
+                try:
+                    from app.services.cache_service import CacheService
+                    cached_tracks, missing_ids = CacheService.get_tracks(track_ids, session_id)
+                    cache_hits = len(cached_tracks)
+                    cache_misses = len(missing_ids)
+                    cache_warmed = CacheService.warm_cache(track_ids, tracks_data_for_cache, session_id)
+                except Exception as e:
+                    logger.warning(f"Failed to warm cache for playlist: {e}")
+
+            tail = {
+                "total_tracks": total_tracks,
+                "followers": playlist_data.get("followers", {}).get("total"),
+                "snapshot_id": playlist_data.get("snapshot_id"),
+                "uri": playlist_data["uri"],
+                "cache_info": {
+                    "hits": cache_hits,
+                    "misses": cache_misses,
+                    "warmed": cache_warmed,
+                    "details": {"track_count": len(track_ids)}
+                }
+            }
+            yield b"]," + orjson.dumps(tail)[1:]
+            logger.info(
+                "Streamed playlist '%s' with %s tracks", playlist_data["name"], len(track_ids)
+            )
+
+        return generate()
+
     def get_playlist_tracks_paginated(
         self,
         playlist_id: str,
@@ -8,6 +8,7 @@ the API responsive.
 import threading
 import logging
 import asyncio
+from time import monotonic
 from typing import Dict
 from concurrent.futures import ThreadPoolExecutor
 
@@ -17,7 +18,6 @@ from app.utils.session_manager import SessionManager
 from app.services.sort_service import (
     sort_playlist_fast,
     sort_playlist_preserve_dates,
-    calculate_moves_needed,
     estimate_sort_time,
     get_sort_key_function
 )
@@ -154,10 +154,13 @@ def _run_sort_job(
         
         logger.info(f"Fetched {len(tracks)} tracks for job {job_id}")
         
-        # Calculate how many tracks need to be moved
+        # Calculate how many tracks need to be moved: extract keys once and
+        # argsort over indices rather than re-running the key per comparison
         key_func, reverse = get_sort_key_function(sort_by, direction)
-        sorted_tracks = sorted(tracks, key=key_func, reverse=reverse)
-        tracks_to_move = calculate_moves_needed(tracks, sorted_tracks)
+        keys = [key_func(t) for t in tracks]
+        ids = [t.get('id') for t in tracks]
+        order = sorted(range(len(tracks)), key=keys.__getitem__, reverse=reverse)
+        tracks_to_move = sum(1 for position, i in enumerate(order) if ids[i] != ids[position])
         total_moves = tracks_to_move if method == 'preserve' else len(tracks)
         
         # Estimate time
@@ -173,10 +176,24 @@ def _run_sort_job(
         logger.info(f"Job {job_id}: {tracks_to_move}/{len(tracks)} tracks need moving")
         original_order = [t.get("uri") for t in tracks if t.get("uri")]
         
-        # Define progress callback
+        # Define progress callback. Writes are throttled: a long preserve
+        # sort reports every move, which would mean one UPDATE + fsync per
+        # track. Flush at most once a second or per 1% of progress; the
+        # final move and terminal status updates always go through.
+        flush_step = max(1, total_moves // 100)
+        last_flush = {"ts": 0.0, "progress": -1}
+
         def progress_callback(current: int, message: str):
-            if not cancel_event.is_set():
-                SortJobService.update_job(job_id, progress=current, message=message)
+            if cancel_event.is_set():
+                return
+            now_mono = monotonic()
+            if (current < total_moves
+                    and now_mono - last_flush["ts"] < 1.0
+                    and current - last_flush["progress"] < flush_step):
+                return
+            last_flush["ts"] = now_mono
+            last_flush["progress"] = current
+            SortJobService.update_job(job_id, progress=current, message=message)
         
         # Define cancellation check
         def should_cancel():
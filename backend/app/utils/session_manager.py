@@ -81,6 +81,11 @@ class SessionManager:
             session_id: Existing session ID from cookie, or None for new session
         """
         self.session_id = session_id
+        # Per-instance memo of the session row. Instances are created per
+        # request (and shared within it via FastAPI's Depends cache), so this
+        # collapses the repeated is_authenticated()/get_user_id() lookups a
+        # route makes into a single DB read. Invalidated on any token write.
+        self._session_cache: Optional[Dict[str, Any]] = None
 
     def get_session_id(self) -> Optional[str]:
         """Return the active session identifier, if any."""
@@ -152,7 +157,10 @@ class SessionManager:
         if not self.session_id:
             logger.error("get_session called with no session_id")
             return None
-        
+
+        if self._session_cache is not None:
+            return self._session_cache
+
         conn = self._get_connection()
         cursor = conn.cursor()
         
@@ -182,7 +190,7 @@ class SessionManager:
             """, (now.isoformat(), self.session_id))
             conn.commit()
             
-            return {
+            session = {
                 "user_id": row[0],
                 "access_token": _decrypt_token(row[1]),
                 "refresh_token": _decrypt_token(row[2]),
@@ -193,6 +201,8 @@ class SessionManager:
                 "updated_at": row[7],
                 "last_used_at": row[8]
             }
+            self._session_cache = session
+            return session
         except sqlite3.Error as e:
             logger.error(f"Failed to get session: {e}")
             return None
@@ -246,6 +256,7 @@ class SessionManager:
                 self.session_id
             ))
             conn.commit()
+            self._session_cache = None
             logger.info(f"Updated tokens for session {self.session_id[:8]}...")
             return True
         except sqlite3.Error as e:
@@ -282,6 +293,7 @@ class SessionManager:
                 WHERE session_id = ?
             """, (self.session_id,))
             conn.commit()
+            self._session_cache = None
             logger.info(f"Deleted session {self.session_id[:8]}...")
             return True
         except sqlite3.Error as e: